@@ -10,14 +10,21 @@ import os
 import sys
 import psutil
 import signal
+import pwd
+import socket
+import struct
 import sysconfig
 import time
 import select
+import selectors
+import math
+import functools
 import termios
 import tty
-from typing import List, Dict, Optional
+import atexit
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
@@ -26,6 +33,162 @@ from rich import print as rprint
 
 console = Console()
 
+# /proc 직접 읽기가 가능한지 (Linux), 아니면 psutil 경로 사용
+HAS_PROCFS = os.path.isdir("/proc/self")
+
+# ss -tulnp 한 줄 파싱: Netid, State, 로컬 포트, (있으면) 첫 번째 프로세스명과 PID
+# 예: tcp LISTEN 0 511 0.0.0.0:3000 0.0.0.0:* users:(("node",pid=1234,fd=20))
+# 출력 전체에 한 번에 적용(re.M)하므로 줄을 넘어가지 않도록 공백은 [ \t]로 제한
+_SS_LINE_RE = re.compile(
+    r"^(\S+)[ \t]+(\S+)[ \t]+\S+[ \t]+\S+[ \t]+\S*:(\d+)[ \t]+\S+"
+    r'(?:[ \t]+users:\(\("([^"]*)",pid=(\d+),)?',
+    re.M,
+)
+
+# NETLINK_SOCK_DIAG 상수 (linux/netlink.h, linux/sock_diag.h, linux/inet_diag.h)
+_NETLINK_SOCK_DIAG = 4
+_SOCK_DIAG_BY_FAMILY = 20
+_NLM_F_REQUEST = 0x01
+_NLM_F_DUMP = 0x300
+_NLMSG_ERROR = 2
+_NLMSG_DONE = 3
+_TCP_LISTEN = 10
+_TCP_CLOSE = 7  # 연결되지 않은 UDP 소켓 (ss의 UNCONN)
+
+# UID -> 사용자명 캐시 (passwd 조회는 프로세스마다 반복할 필요 없음)
+_username_cache: Dict[int, str] = {}
+
+
+def _read_proc_file(path: str, bufsize: int = 65536) -> bytes:
+    """/proc 파일을 raw fd로 읽기 (open/read/close 외 추가 syscall 없음)
+
+    내장 open()은 fstat, isatty ioctl, lseek 등을 추가로 호출하므로
+    작은 /proc 파일을 PID마다 여러 개 읽을 때는 os.open/os.read가 더 가볍다.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        data = os.read(fd, bufsize)
+        # procfs는 요청보다 짧게 읽히면 EOF이므로 버퍼가 가득 찬 경우만 이어서 읽음
+        if len(data) == bufsize:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, bufsize)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _parse_ss_output(text: str) -> List[Dict]:
+    """ss -tulnp 출력에서 기본 포트 정보(프로토콜, 상태, 포트, PID, 프로세스명) 추출"""
+    # 줄 분리 없이 출력 전체를 정규식 엔진(C)에서 한 번에 스캔
+    # 헤더 줄은 "Address:Port"에 숫자 포트가 없어 매칭되지 않음
+    return [
+        {
+            "protocol": protocol,
+            "state": state,
+            "port": int(port),
+            "pid": int(pid) if pid else None,
+            "process_name": process_name or "Unknown",
+        }
+        for protocol, state, port, process_name, pid in _SS_LINE_RE.findall(text)
+    ]
+
+
+def _sock_diag_dump(family: int, protocol: int, states: int) -> List[Tuple[int, int, int]]:
+    """NETLINK_SOCK_DIAG로 소켓 목록 조회 (ss가 내부적으로 쓰는 인터페이스)
+
+    반환: (로컬 포트, TCP 상태, 소켓 inode) 목록
+    """
+    # nlmsghdr + inet_diag_req_v2 (inet_diag_sockid는 전부 0 = 전체 덤프)
+    req = struct.pack("=BBBBI", family, protocol, 0, 0, states) + bytes(48)
+    header = struct.pack(
+        "=IHHII", 16 + len(req), _SOCK_DIAG_BY_FAMILY, _NLM_F_REQUEST | _NLM_F_DUMP, 1, 0
+    )
+
+    sockets = []
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, _NETLINK_SOCK_DIAG) as sock:
+        sock.sendto(header + req, (0, 0))
+        while True:
+            data = sock.recv(65536)
+            offset = 0
+            while offset + 16 <= len(data):
+                msg_len, msg_type = struct.unpack_from("=IH", data, offset)
+                if msg_type == _NLMSG_DONE:
+                    return sockets
+                if msg_type == _NLMSG_ERROR:
+                    errno = -struct.unpack_from("=i", data, offset + 16)[0]
+                    raise OSError(errno, os.strerror(errno))
+                # inet_diag_msg: state(+1), sport(+4, big-endian), inode(+68)
+                body = offset + 16
+                state = data[body + 1]
+                (sport,) = struct.unpack_from("!H", data, body + 4)
+                (inode,) = struct.unpack_from("=I", data, body + 68)
+                sockets.append((sport, state, inode))
+                offset += (msg_len + 3) & ~3
+
+
+def _map_socket_inodes_to_pids(inodes: Set[int]) -> Dict[int, int]:
+    """/proc/*/fd 를 한 번 훑어 소켓 inode -> PID 매핑 (필요한 inode를 다 찾으면 중단)"""
+    inode_pid = {}
+    remaining = set(inodes)
+    with os.scandir("/proc") as proc_entries:
+        for proc_entry in proc_entries:
+            if not proc_entry.name.isdigit():
+                continue
+            try:
+                with os.scandir(f"/proc/{proc_entry.name}/fd") as fd_entries:
+                    for fd_entry in fd_entries:
+                        try:
+                            target = os.readlink(fd_entry.path)
+                        except OSError:
+                            continue
+                        if target.startswith("socket:["):
+                            inode = int(target[8:-1])
+                            if inode in remaining:
+                                inode_pid[inode] = int(proc_entry.name)
+                                remaining.discard(inode)
+            except OSError:
+                # 종료된 프로세스 또는 다른 사용자의 fd 디렉토리
+                continue
+            if not remaining:
+                break
+    return inode_pid
+
+
+def _read_process_name(pid: int) -> str:
+    """/proc/<pid>/comm에서 프로세스명 읽기 (ss가 표시하는 이름과 동일)"""
+    try:
+        return _read_proc_file(f"/proc/{pid}/comm").decode(errors="replace").strip()
+    except OSError:
+        return "Unknown"
+
+
+def _process_start_time(pid: int) -> Optional[float]:
+    """프로세스 시작 시각 (PID 재사용 구분용, 조회 실패 시 None)"""
+    try:
+        if HAS_PROCFS:
+            # comm에 공백/괄호가 있을 수 있어 마지막 ')' 이후만 분리 (인덱스 19 = starttime)
+            return int(_read_proc_file(f"/proc/{pid}/stat").rpartition(b")")[2].split()[19])
+        return psutil.Process(pid).create_time()
+    except (OSError, ValueError, IndexError, psutil.Error):
+        return None
+
+
+def _username_for_uid(uid: int) -> str:
+    """UID를 사용자명으로 변환 (캐시 사용)"""
+    name = _username_cache.get(uid)
+    if name is None:
+        try:
+            name = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            name = str(uid)
+        _username_cache[uid] = name
+    return name
+
 
 class FreeThreadingPortMonitor:
     # 시스템 서비스 매핑 (프로세스명 -> 친숙한 이름)
@@ -46,19 +209,96 @@ class FreeThreadingPortMonitor:
         "ntopng": "ntopng (네트워크)",
     }
 
+    # 병렬 상세 조회 대기 한도(초). 응답 없는 PID(D 상태 등) 하나가 갱신 전체를 막지 않도록 함
+    DETAILS_TIMEOUT = 2.0
+
+    # 캐시된 메모리 사용량을 다시 읽는 주기(초). cwd/cmdline/user/앱 정보는 PID가 살아있는 동안 유지
+    VOLATILE_TTL = 30
+
+    # 이 개수 이하의 PID는 스레드 풀에 넘기지 않고 바로 조회 (작업 전달 비용이 조회보다 큼)
+    SERIAL_PID_THRESHOLD = 2
+
+    # 모드(모바일 여부)별 테이블 컬럼 정의 (헤더, add_column 인자) - 갱신마다 이 값으로 새 Table 생성
+    TABLE_COLUMNS = {
+        # 모바일 모드: No., Port, App, Memory 표시
+        True: (
+            ("No.", {"style": "bold white", "width": 3}),
+            ("Port", {"style": "cyan", "width": 5}),
+            ("App", {"style": "bold green"}),
+            ("Mem", {"style": "red", "width": 6}),
+        ),
+        # PC 모드: 전체 정보 표시
+        False: (
+            ("No.", {"style": "bold white", "width": 4}),
+            ("Port", {"style": "cyan", "width": 6}),
+            ("App Name", {"style": "bold cyan", "width": 28}),
+            ("Project Path", {"style": "green", "width": 32}),
+            ("PID", {"style": "yellow", "width": 8}),
+            ("Mem", {"style": "red", "width": 8}),
+            ("User", {"style": "magenta", "width": 10}),
+        ),
+    }
+
     def __init__(self, start_port=443, end_port=9000):
         self.port_range = (start_port, end_port)
         # sudo 비밀번호는 환경변수 SUDO_PASSWORD에서 가져오거나 직접 입력
         self.sudo_password = os.getenv("SUDO_PASSWORD", "")
+        # 빌드 설정(--disable-gil)과 실제 런타임 GIL 상태는 다를 수 있음
+        self.free_threading_build = sysconfig.get_config_var("Py_GIL_DISABLED") == 1
         self.gil_disabled = self.check_gil_status()
-        self.max_workers = os.cpu_count() or 4
-        # 프로세스 정보 캐시 (PID -> 정보)
-        self._process_cache = {}
+        self._gil_warning_shown = False
+        # sudo -n 또는 sudo -v가 한 번이라도 성공했는지
+        self._sudo_primed = False
+        # sudo -v(비밀번호 전달)가 실패했는지 - 실패하면 다시 시도하지 않음 (faillock 잠금 방지)
+        self._sudo_prime_failed = False
+        # cgroup/taskset 제한을 반영한 실제 사용 가능 CPU 수 (컨테이너에서 과다 할당 방지)
+        if hasattr(os, "sched_getaffinity"):
+            self.max_workers = len(os.sched_getaffinity(0))
+        else:
+            self.max_workers = os.cpu_count() or 4
+        # 프로세스 정보 캐시 (PID -> 정보), 갱신 사이에도 유지
+        self._process_cache: Dict[int, Dict] = {}
+        # PID별 메모리 정보 조회 시각 (time.monotonic)
+        self._cache_ts: Dict[int, float] = {}
+        # PID별 캐시 당시 프로세스 시작 시각 (다르면 같은 번호로 재사용된 다른 프로세스)
+        self._cache_start: Dict[int, Optional[float]] = {}
+        # 마지막 포트 조회 결과 (숨김/취소 등 데이터 변화 없는 동작은 이 값으로 다시 그림)
+        self.ports_info: List[Dict] = []
+        # 병렬 조회용 스레드 풀 (get_executor에서 한 번만 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # stdin 입력 대기용 셀렉터 (Linux: epoll), 한 번만 등록해 매 호출마다 fd 목록을 만들지 않음
+        self._selector: Optional[selectors.BaseSelector] = None
+        try:
+            selector = selectors.DefaultSelector()
+            try:
+                selector.register(sys.stdin, selectors.EVENT_READ)
+            except (ValueError, OSError):
+                # 일반 파일/닫힌 stdin 등 epoll 등록 불가 → select.select로 대체
+                selector.close()
+            else:
+                self._selector = selector
+        except OSError:
+            pass
 
     def check_gil_status(self) -> bool:
-        """Python 3.14 Free-threading 지원 여부 확인"""
-        gil_disabled = sysconfig.get_config_var("Py_GIL_DISABLED") == 1
-        return gil_disabled
+        """현재 GIL이 실제로 비활성화되어 있는지 확인 (런타임 상태)
+
+        free-threading 빌드라도 PYTHON_GIL=1, -X gil=1 또는 free-threading 미지원
+        C 확장(psutil 등) import 시 GIL이 다시 활성화될 수 있다.
+        """
+        return getattr(sys, "_is_gil_enabled", lambda: True)() is False
+
+    def refresh_gil_status(self) -> bool:
+        """GIL 상태 재확인 (빌드는 지원하지만 GIL이 다시 켜졌으면 한 번 경고)"""
+        self.gil_disabled = self.check_gil_status()
+        if self.free_threading_build and not self.gil_disabled and not self._gil_warning_shown:
+            self._gil_warning_shown = True
+            console.print(
+                "[yellow]⚠️  Free-threading 빌드이지만 GIL이 다시 활성화되었습니다 "
+                "(PYTHON_GIL 설정 또는 GIL을 요구하는 C 확장 import 시 출력된 "
+                "RuntimeWarning 참고) → 순차 처리 사용[/yellow]"
+            )
+        return self.gil_disabled
 
     def display_python_info(self):
         """Python 및 Free-threading 정보 표시"""
@@ -70,6 +310,9 @@ class FreeThreadingPortMonitor:
             info_lines.append("✅ Free-threading 모드 (GIL 비활성화)")
             info_lines.append(f"   → 진정한 멀티코어 병렬 처리 가능!")
             info_lines.append(f"   → 최대 워커: {self.max_workers}개")
+        elif self.free_threading_build:
+            info_lines.append("⚠️  Free-threading 빌드이지만 GIL이 런타임에 활성화됨")
+            info_lines.append("   → PYTHON_GIL 환경변수 또는 GIL을 요구하는 C 확장 확인")
         else:
             info_lines.append("⚠️  일반 모드 (GIL 활성화)")
             info_lines.append("   → 스레드가 순차적으로 실행됨")
@@ -134,17 +377,38 @@ class FreeThreadingPortMonitor:
         return last_folder if last_folder else "Unknown"
 
     def get_process_details_cached(self, pid: int) -> Dict:
-        """캐시된 프로세스 정보 가져오기 (중복 조회 방지)"""
-        if pid in self._process_cache:
-            return self._process_cache[pid]
+        """캐시된 프로세스 정보 가져오기 (새 PID만 전체 조회, 기존 PID는 메모리만 주기적 갱신)
+
+        캐시는 (PID, 시작 시각)이 모두 같을 때만 사용한다.
+        """
+        now = time.monotonic()
+        start_time = _process_start_time(pid)
+        details = self._process_cache.get(pid)
+
+        if details is None or start_time is None or self._cache_start.get(pid) != start_time:
+            details = self.get_process_details_fast(pid)
+            self._cache_start[pid] = start_time
+        elif now - self._cache_ts[pid] >= self.VOLATILE_TTL:
+            details = {**details, "memory": self.get_process_memory(pid)}
+        else:
+            return details
 
-        details = self.get_process_details_single(pid)
         self._process_cache[pid] = details
+        self._cache_ts[pid] = now
         return details
 
+    def evict_process_cache(self, live_pids: Set[int]):
+        """사라진 PID의 캐시 항목 제거"""
+        for pid in self._process_cache.keys() - live_pids:
+            del self._process_cache[pid]
+            self._cache_ts.pop(pid, None)
+            self._cache_start.pop(pid, None)
+
     def clear_process_cache(self):
         """프로세스 캐시 초기화"""
         self._process_cache.clear()
+        self._cache_ts.clear()
+        self._cache_start.clear()
 
     def get_app_name_from_package_json(self, cwd: str) -> Optional[str]:
         """package.json에서 앱 이름 추출"""
@@ -252,15 +516,26 @@ class FreeThreadingPortMonitor:
         """단일 프로세스의 상세 정보 가져오기"""
         try:
             process = psutil.Process(pid)
-            cmdline = process.cmdline()
+            # oneshot: /proc/<pid>/stat, status 등을 한 번만 읽고 여러 속성에 재사용
+            with process.oneshot():
+                info = process.as_dict(
+                    attrs=["cwd", "cmdline", "memory_info", "username"],
+                    ad_value=None,
+                )
+            if info["cwd"] is None:
+                # 기존과 동일하게 cwd 접근 불가 시 전체를 Unknown 처리
+                raise psutil.AccessDenied(pid)
+
+            cmdline = info["cmdline"] or []
             if len(cmdline) > 3:
                 cmdline_str = " ".join(cmdline[:3]) + "..."
             else:
                 cmdline_str = " ".join(cmdline)
 
-            cwd = process.cwd()
+            cwd = info["cwd"]
             app_name = self.get_app_name_from_package_json(cwd)
             description = self.get_project_description(cwd)
+            memory_info = info["memory_info"]
 
             return {
                 "pid": pid,
@@ -268,9 +543,8 @@ class FreeThreadingPortMonitor:
                 "app_name": app_name,
                 "description": description,
                 "cmdline": cmdline_str,
-                "memory": f"{process.memory_info().rss / 1024 / 1024:.1f}MB",
-                "cpu": f"{process.cpu_percent():.1f}%",
-                "user": process.username(),
+                "memory": f"{memory_info.rss / 1024 / 1024:.1f}MB" if memory_info else "N/A",
+                "user": info["username"] or "N/A",
             }
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return {
@@ -280,67 +554,193 @@ class FreeThreadingPortMonitor:
                 "description": None,
                 "cmdline": "",
                 "memory": "N/A",
-                "cpu": "N/A",
                 "user": "N/A",
             }
 
-    def get_open_ports_sequential(self) -> List[Dict]:
-        """순차적으로 포트 정보 수집 (기존 방식)"""
+    def get_process_memory(self, pid: int) -> str:
+        """프로세스 메모리(RSS)만 다시 읽기"""
         try:
-            cmd = f"echo '{self.sudo_password}' | sudo -S ss -tulnp '( sport >= :{self.port_range[0]} and sport <= :{self.port_range[1]} )'"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            if HAS_PROCFS:
+                for line in _read_proc_file(f"/proc/{pid}/status").split(b"\n"):
+                    if line.startswith(b"VmRSS:"):
+                        return f"{int(line.split()[1]) / 1024:.1f}MB"
+                return "0.0MB"
+            return f"{psutil.Process(pid).memory_info().rss / 1024 / 1024:.1f}MB"
+        except (OSError, psutil.Error):
+            return "N/A"
+
+    def get_process_details_fast(self, pid: int) -> Dict:
+        """/proc를 직접 읽어 프로세스 상세 정보 가져오기 (Linux 전용, psutil 우회)"""
+        if not HAS_PROCFS:
+            return self.get_process_details_single(pid)
 
-            if result.returncode != 0:
-                console.print("[red]Error running ss command[/red]")
-                return []
+        try:
+            cwd = os.readlink(f"/proc/{pid}/cwd")
+            status = _read_proc_file(f"/proc/{pid}/status")
+            cmdline_raw = _read_proc_file(f"/proc/{pid}/cmdline")
+        except OSError:
+            # 프로세스 종료(ENOENT/ESRCH) 또는 권한 없음(EACCES)
+            return {
+                "pid": pid,
+                "cwd": "Unknown",
+                "app_name": None,
+                "description": None,
+                "cmdline": "",
+                "memory": "N/A",
+                "user": "N/A",
+            }
 
-            ports_info = []
-            lines = result.stdout.strip().split("\n")[1:]
+        rss_kb = 0
+        uid = None
+        for line in status.split(b"\n"):
+            if line.startswith(b"Uid:"):
+                uid = int(line.split()[1])
+            elif line.startswith(b"VmRSS:"):
+                rss_kb = int(line.split()[1])
+                break  # VmRSS는 Uid 뒤에 위치
+
+        cmdline = [arg.decode(errors="replace") for arg in cmdline_raw.split(b"\0") if arg]
+        if len(cmdline) > 3:
+            cmdline_str = " ".join(cmdline[:3]) + "..."
+        else:
+            cmdline_str = " ".join(cmdline)
+
+        return {
+            "pid": pid,
+            "cwd": cwd,
+            "app_name": self.get_app_name_from_package_json(cwd),
+            "description": self.get_project_description(cwd),
+            "cmdline": cmdline_str,
+            "memory": f"{rss_kb / 1024:.1f}MB",
+            "user": _username_for_uid(uid) if uid is not None else "N/A",
+        }
+
+    def list_listening_ports_netlink(self) -> List[Dict]:
+        """netlink(SOCK_DIAG)로 대기 중인 TCP/UDP 소켓 조회 (ss 프로세스 실행 없음)"""
+        start_port, end_port = self.port_range
+        found = []
+        for protocol_name, protocol, states, state_name in (
+            ("tcp", socket.IPPROTO_TCP, 1 << _TCP_LISTEN, "LISTEN"),
+            ("udp", socket.IPPROTO_UDP, 1 << _TCP_CLOSE, "UNCONN"),
+        ):
+            for family in (socket.AF_INET, socket.AF_INET6):
+                for sport, _, inode in _sock_diag_dump(family, protocol, states):
+                    if start_port <= sport <= end_port:
+                        found.append((protocol_name, state_name, sport, inode))
+
+        inode_pid = _map_socket_inodes_to_pids({inode for *_, inode in found if inode})
+        process_names = {}
+        basic_ports_info = []
+        for protocol_name, state_name, sport, inode in found:
+            pid = inode_pid.get(inode)
+            if pid and pid not in process_names:
+                process_names[pid] = _read_process_name(pid)
+            basic_ports_info.append(
+                {
+                    "protocol": protocol_name,
+                    "state": state_name,
+                    "port": sport,
+                    "pid": pid,
+                    "process_name": process_names[pid] if pid else "Unknown",
+                }
+            )
+        return basic_ports_info
+
+    def prime_sudo(self) -> bool:
+        """sudo 인증 타임스탬프 갱신 (비밀번호는 이때 한 번만 stdin으로 전달)"""
+        result = subprocess.run(
+            ["sudo", "-S", "-v"],
+            input=self.sudo_password + "\n",
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            self._sudo_primed = True
+        else:
+            self._sudo_prime_failed = True
+        return result.returncode == 0
+
+    def run_sudo(self, argv: List[str]) -> subprocess.CompletedProcess:
+        """sudo -n으로 명령 실행 (셸 없음, root면 직접 실행)
+
+        sudo가 비밀번호를 요구할 때만 sudo -v로 인증한 뒤 한 번 재시도한다.
+        NOPASSWD 설정이면 비밀번호를 보내지 않고, 인증이 한 번 실패하면 다시 보내지 않는다.
+        명령 자체의 실패(ss 오류, 이미 종료된 PID 등)는 재시도하지 않는다.
+        """
+        if os.geteuid() == 0:
+            return subprocess.run(argv, capture_output=True, text=True)
+        # sudo 메시지로 비밀번호 요구 여부를 판단하므로 로케일 고정
+        env = {**os.environ, "LC_ALL": "C"}
+        try:
+            result = subprocess.run(["sudo", "-n", *argv], capture_output=True, text=True, env=env)
+            if result.returncode == 0:
+                self._sudo_primed = True
+            elif (
+                "password is required" in result.stderr
+                and not self._sudo_prime_failed
+                and self.prime_sudo()
+            ):
+                result = subprocess.run(
+                    ["sudo", "-n", *argv], capture_output=True, text=True, env=env
+                )
+        except FileNotFoundError as e:
+            result = subprocess.CompletedProcess(argv, 127, "", str(e))
+        return result
+
+    def list_listening_ports(self) -> Optional[List[Dict]]:
+        """기본 포트 정보 목록 (실패 시 None)
 
-            for line in lines:
-                if not line.strip() or "[sudo]" in line:
-                    continue
+        root로 실행 중이면 모든 /proc/<pid>/fd를 읽을 수 있으므로 netlink로 직접 조회하고,
+        그 외에는 다른 사용자 프로세스의 PID까지 보기 위해 sudo ss를 사용한다.
+        """
+        if HAS_PROCFS and os.geteuid() == 0:
+            try:
+                return self.list_listening_ports_netlink()
+            except OSError:
+                pass  # netlink 미지원 커널 등: ss로 대체
+
+        result = self.run_sudo(
+            [
+                "ss",
+                "-tulnp",
+                f"( sport >= :{self.port_range[0]} and sport <= :{self.port_range[1]} )",
+            ]
+        )
 
-                parts = line.split()
-                if len(parts) < 6:
-                    continue
+        if result.returncode != 0:
+            console.print("[red]Error running ss command[/red]")
+            return None
 
-                # 포트 정보 파싱
-                local_addr = parts[4]
-                port_match = re.search(r":(\d+)$", local_addr)
-                if not port_match:
-                    continue
+        return _parse_ss_output(result.stdout)
 
-                port = int(port_match.group(1))
+    def get_open_ports_sequential(self) -> List[Dict]:
+        """순차적으로 포트 정보 수집 (기존 방식)"""
+        try:
+            basic_ports_info = self.list_listening_ports()
+            if basic_ports_info is None:
+                return []
 
-                # PID 추출
-                pid_match = re.search(r"pid=(\d+)", line)
-                pid = int(pid_match.group(1)) if pid_match else None
+            self.evict_process_cache({info["pid"] for info in basic_ports_info if info["pid"]})
+            ports_info = []
 
-                # 프로세스 이름 추출
-                process_match = re.search(r'"([^"]+)"', line)
-                process_name = process_match.group(1) if process_match else "Unknown"
+            for basic_info in basic_ports_info:
+                pid = basic_info["pid"]
 
-                # 프로세스 상세 정보 (순차적)
-                process_info = self.get_process_details_single(pid) if pid else {}
+                # 프로세스 상세 정보 (순차적, 병렬 경로와 같은 캐시 사용)
+                process_info = self.get_process_details_cached(pid) if pid else {}
 
                 # 프로젝트 폴더 추출
                 project_folder = self.extract_project_folder(process_info.get("cwd", ""))
 
                 ports_info.append(
                     {
-                        "protocol": parts[0],
-                        "state": parts[1],
-                        "port": port,
-                        "pid": pid,
-                        "process_name": process_name,
+                        **basic_info,
                         "project_folder": project_folder,
                         "app_name": process_info.get("app_name"),
                         "description": process_info.get("description"),
                         "cwd": process_info.get("cwd", "Unknown"),
                         "cmdline": process_info.get("cmdline", ""),
                         "memory": process_info.get("memory", "N/A"),
-                        "cpu": process_info.get("cpu", "N/A"),
                         "user": process_info.get("user", "N/A"),
                     }
                 )
@@ -351,66 +751,44 @@ class FreeThreadingPortMonitor:
             console.print(f"[red]Error: {e}[/red]")
             return []
 
+    def get_executor(self) -> ThreadPoolExecutor:
+        """갱신마다 재사용하는 스레드 풀 (처음 병렬 조회 시 생성, 종료 시 atexit로 정리)"""
+        if self._executor is None:
+            # /proc 직접 읽기로 PID당 작업이 가벼워졌으므로 워커 수를 작게 유지
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(8, self.max_workers), thread_name_prefix="port-mon"
+            )
+            atexit.register(self._executor.shutdown, cancel_futures=True)
+        return self._executor
+
     def get_open_ports_parallel(self) -> List[Dict]:
         """병렬로 포트 정보 수집 (Free-threading 최적화)"""
         try:
-            cmd = f"echo '{self.sudo_password}' | sudo -S ss -tulnp '( sport >= :{self.port_range[0]} and sport <= :{self.port_range[1]} )'"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                console.print("[red]Error running ss command[/red]")
-                return []
-
             # 먼저 기본 포트 정보만 수집
-            basic_ports_info = []
-            lines = result.stdout.strip().split("\n")[1:]
-
-            for line in lines:
-                if not line.strip() or "[sudo]" in line:
-                    continue
-
-                parts = line.split()
-                if len(parts) < 6:
-                    continue
-
-                # 포트 정보 파싱
-                local_addr = parts[4]
-                port_match = re.search(r":(\d+)$", local_addr)
-                if not port_match:
-                    continue
-
-                port = int(port_match.group(1))
-
-                # PID 추출
-                pid_match = re.search(r"pid=(\d+)", line)
-                pid = int(pid_match.group(1)) if pid_match else None
-
-                # 프로세스 이름 추출
-                process_match = re.search(r'"([^"]+)"', line)
-                process_name = process_match.group(1) if process_match else "Unknown"
-
-                basic_ports_info.append(
-                    {
-                        "protocol": parts[0],
-                        "state": parts[1],
-                        "port": port,
-                        "pid": pid,
-                        "process_name": process_name,
-                    }
-                )
+            basic_ports_info = self.list_listening_ports()
+            if basic_ports_info is None:
+                return []
 
             # PID 목록 추출 (중복 제거로 조회 최소화)
             unique_pids = list(set(info["pid"] for info in basic_ports_info if info["pid"]))
+            self.evict_process_cache(set(unique_pids))
 
             # 병렬로 프로세스 상세 정보 수집 (중복 PID는 한 번만 조회)
             process_details_map = {}
-            if unique_pids:
-                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if len(unique_pids) <= self.SERIAL_PID_THRESHOLD:
+                process_details_map = {
+                    pid: self.get_process_details_cached(pid) for pid in unique_pids
+                }
+            else:
+                executor = self.get_executor()
+                futures = {}
+                try:
                     futures = {
                         executor.submit(self.get_process_details_cached, pid): pid
                         for pid in unique_pids
                     }
-                    for future in futures:
+                    # 완료된 순서대로 처리 (느린 PID가 이미 끝난 결과를 붙잡지 않음)
+                    for future in as_completed(futures, timeout=self.DETAILS_TIMEOUT):
                         pid = futures[future]
                         try:
                             details = future.result()
@@ -422,9 +800,13 @@ class FreeThreadingPortMonitor:
                                 "description": None,
                                 "cmdline": "",
                                 "memory": "N/A",
-                                "cpu": "N/A",
                                 "user": "N/A",
                             }
+                except FuturesTimeout:
+                    # 시간 내 응답 없는 PID는 아래에서 Unknown/N/A로 표시됨
+                    # 아직 시작하지 않은 작업은 취소해 다음 갱신의 워커를 붙잡지 않게 함
+                    for future in futures:
+                        future.cancel()
 
             # 최종 포트 정보 구성
             ports_info = []
@@ -443,7 +825,6 @@ class FreeThreadingPortMonitor:
                         "cwd": process_info.get("cwd", "Unknown"),
                         "cmdline": process_info.get("cmdline", ""),
                         "memory": process_info.get("memory", "N/A"),
-                        "cpu": process_info.get("cpu", "N/A"),
                         "user": process_info.get("user", "N/A"),
                     }
                 )
@@ -456,12 +837,10 @@ class FreeThreadingPortMonitor:
 
     def get_open_ports(self, use_parallel=None) -> tuple[List[Dict], float]:
         """포트 정보 수집 (자동으로 최적 방식 선택)"""
-        # 캐시 초기화 (매 조회 시 새로운 데이터)
-        self.clear_process_cache()
-
         # use_parallel이 명시되지 않으면 GIL 상태에 따라 자동 결정
         if use_parallel is None:
-            use_parallel = self.gil_disabled
+            # psutil 등 C 확장 import 후 GIL이 다시 켜질 수 있으므로 매번 런타임 상태 확인
+            use_parallel = self.refresh_gil_status()
 
         start_time = time.time()
 
@@ -486,11 +865,20 @@ class FreeThreadingPortMonitor:
 
         return Path(cwd).name if cwd else "Unknown"
 
-    def display_ports_with_actions(self, ports_info: List[Dict]):
-        """포트 정보를 테이블로 표시 (모바일 자동 감지)"""
-        # ANSI escape: 화면 지우고 커서를 맨 위로 이동 (tmux 호환)
-        sys.stdout.write("\033[2J\033[H")
-        sys.stdout.flush()
+    def get_ports_table(self, is_mobile: bool) -> Table:
+        """모드별 빈 포트 테이블 생성 (컬럼 정의는 TABLE_COLUMNS를 그대로 사용)"""
+        table = Table(show_header=True, header_style="bold magenta")
+        for header, options in self.TABLE_COLUMNS[is_mobile]:
+            table.add_column(header, **options)
+        return table
+
+    def display_ports_with_actions(self, ports_info: List[Dict]) -> List[Dict]:
+        """포트 정보를 테이블로 표시 (모바일 자동 감지)
+
+        화면에 표시한 순서(포트 번호순)로 정렬된 목록을 반환한다.
+        kill/hide의 No. 선택은 반드시 이 반환값으로 인덱싱해야 화면과 일치한다.
+        """
+        ports_info = sorted(ports_info, key=lambda x: x["port"])
 
         # 터미널 폭 감지하여 모바일/PC 모드 결정
         try:
@@ -500,37 +888,10 @@ class FreeThreadingPortMonitor:
 
         is_mobile = term_width < 80  # 80컬럼 미만이면 모바일 모드
 
-        # 헤더 정보
-        header_text = f"🚀 Port Monitor ({self.port_range[0]}-{self.port_range[1]})"
-        console.print(Panel(header_text, style="bold cyan"))
+        # 테이블 (모바일: 간소화, PC: 전체 정보) - 컬럼 구성은 모드별로 재사용
+        table = self.get_ports_table(is_mobile)
 
-        # 타임스탬프
-        timestamp = time.strftime("%H:%M:%S" if is_mobile else "%Y-%m-%d %H:%M:%S")
-        console.print(f"[dim]{timestamp}[/dim]")
-        if not is_mobile:
-            console.print(f"[dim]Usage: Type process No. and press Enter to kill[/dim]")
-        console.print("")
-
-        # 테이블 (모바일: 간소화, PC: 전체 정보)
-        table = Table(show_header=True, header_style="bold magenta")
-
-        if is_mobile:
-            # 모바일 모드: No., Port, App, Memory 표시
-            table.add_column("No.", style="bold white", width=3)
-            table.add_column("Port", style="cyan", width=5)
-            table.add_column("App", style="bold green")
-            table.add_column("Mem", style="red", width=6)
-        else:
-            # PC 모드: 전체 정보 표시
-            table.add_column("No.", style="bold white", width=4)
-            table.add_column("Port", style="cyan", width=6)
-            table.add_column("App Name", style="bold cyan", width=28)
-            table.add_column("Project Path", style="green", width=32)
-            table.add_column("PID", style="yellow", width=8)
-            table.add_column("Mem", style="red", width=8)
-            table.add_column("User", style="magenta", width=10)
-
-        for idx, port in enumerate(sorted(ports_info, key=lambda x: x["port"]), 1):
+        for idx, port in enumerate(ports_info, 1):
             # 친숙한 앱 이름 생성 (시스템 서비스, 설명, 폴더명 처리)
             app_name = self.get_friendly_app_name(
                 port.get("process_name", "Unknown"),
@@ -563,9 +924,27 @@ class FreeThreadingPortMonitor:
                     port["user"],
                 )
 
-        console.print(table)
-        console.print(f"\n[bold]Total:[/bold] {len(ports_info)}")
-        console.print("")  # 카운트다운과 구분용 빈 줄
+        # 화면 전체를 지우지(\033[2J) 않고 한 프레임으로 만들어 맨 위부터 덮어씀
+        # (줄마다 \033[K로 남은 글자 제거, 끝에서 \033[J로 아래쪽 정리 → 깜빡임 없음)
+        with console.capture() as capture:
+            # 헤더 정보
+            header_text = f"🚀 Port Monitor ({self.port_range[0]}-{self.port_range[1]})"
+            console.print(Panel(header_text, style="bold cyan"))
+
+            # 타임스탬프
+            timestamp = time.strftime("%H:%M:%S" if is_mobile else "%Y-%m-%d %H:%M:%S")
+            console.print(f"[dim]{timestamp}[/dim]")
+            if not is_mobile:
+                console.print(f"[dim]Usage: Type process No. and press Enter to kill[/dim]")
+            console.print("")
+
+            console.print(table)
+            console.print(f"\n[bold]Total:[/bold] {len(ports_info)}")
+            console.print("")  # 카운트다운과 구분용 빈 줄
+
+        frame = capture.get()
+        sys.stdout.write("\033[H" + frame.replace("\n", "\033[K\n") + "\033[J")
+        sys.stdout.flush()
 
         return ports_info
 
@@ -580,8 +959,13 @@ class FreeThreadingPortMonitor:
                 console.print(f"[green]✓ Sent {signal_name} to process {pid}[/green]")
                 return True
             except PermissionError:
-                cmd = f"echo '{self.sudo_password}' | sudo -S kill -{signal_type} {pid}"
-                subprocess.run(cmd, shell=True, check=True, capture_output=True)
+                # int()로 변환하지 않으면 f-string이 "-Signals.SIGKILL"이 됨
+                result = self.run_sudo(["kill", f"-{int(signal_type)}", str(pid)])
+                if result.returncode != 0:
+                    console.print(
+                        f"[red]✗ Error killing process {pid}: {result.stderr.strip()}[/red]"
+                    )
+                    return False
                 console.print(f"[green]✓ Killed process {pid} with sudo[/green]")
                 return True
 
@@ -615,6 +999,8 @@ class FreeThreadingPortMonitor:
         parallel_times = []
         for i in range(iterations):
             console.print(f"  테스트 {i+1}/{iterations}...", end=" ")
+            # 캐시 적중이 아닌 실제 수집 시간을 비교하도록 매번 초기화
+            self.clear_process_cache()
             _, elapsed = self.get_open_ports(use_parallel=True)
             parallel_times.append(elapsed)
             console.print(f"{elapsed:.3f}초")
@@ -657,26 +1043,48 @@ class FreeThreadingPortMonitor:
 
         console.print("=" * 70 + "\n")
 
-    def get_non_blocking_input(self, timeout=1):
-        """비차단 입력 받기"""
+    @staticmethod
+    def read_stdin_char() -> Optional[str]:
+        """stdin fd에서 1바이트 직접 읽기
+
+        sys.stdin.read(1)은 TextIOWrapper가 준비된 바이트를 모두 버퍼로 가져가서,
+        남은 입력(붙여넣기/빠른 입력)을 epoll/select가 다시 알려주지 않는다.
+        """
+        data = os.read(sys.stdin.fileno(), 1)
+        return data.decode(errors="ignore") if data else None
+
+    def close_selector(self):
+        """stdin 셀렉터 닫기 (여러 번 호출해도 안전)"""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def get_non_blocking_input(self, timeout: float = 1) -> Optional[str]:
+        """비차단 입력 받기 (입력이 오거나 timeout이 지나면 바로 반환)"""
+        if self._selector is not None:
+            if self._selector.select(timeout):
+                return self.read_stdin_char()
+            return None
         if sys.stdin in select.select([sys.stdin], [], [], timeout)[0]:
-            return sys.stdin.read(1)
+            return self.read_stdin_char()
         return None
 
-    def get_multi_char_input(self, prompt_text: str, timeout: int = 30) -> str:
+    def get_multi_char_input(self, prompt_text: str, timeout: int = 30) -> Optional[str]:
         """멀티 문자 입력을 받는 함수 (개선됨 - ESC는 None 반환)"""
         sys.stdout.write("\r\033[K")
         sys.stdout.write(prompt_text)
         sys.stdout.flush()
 
         input_text = ""
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
         while True:
-            if time.time() - start_time > timeout:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
 
-            char = self.get_non_blocking_input(0.1)
+            # 키 입력이 올 때까지 한 번에 대기 (0.1초 폴링 없음)
+            char = self.get_non_blocking_input(remaining)
             if char == "\n" or char == "\r":
                 break
             elif char and char.isdigit():
@@ -696,8 +1104,20 @@ class FreeThreadingPortMonitor:
 
         return input_text
 
-    def quick_view(self, interval=60):
-        """자동 갱신 모드 (카운트다운 포함)"""
+    def _redisplay(self, hidden_pids: Set[int]) -> List[Dict]:
+        """마지막 조회 결과(self.ports_info)로 화면만 다시 그리기 (ss 재실행 없음)"""
+        visible_ports = [p for p in self.ports_info if p["pid"] not in hidden_pids]
+        return self.display_ports_with_actions(visible_ports)
+
+    def _after_action(
+        self, hidden_pids: Set[int], interval: int, use_parallel: Optional[bool] = None
+    ) -> tuple[List[Dict], float]:
+        """액션 처리 후 공통 마무리: 재조회, 숨김 필터, 화면 갱신, 다음 갱신 시각 반환"""
+        self.ports_info, _ = self.get_open_ports(use_parallel)
+        return self._redisplay(hidden_pids), time.monotonic() + interval
+
+    def quick_view(self, interval: int = 60, use_parallel: Optional[bool] = None) -> None:
+        """자동 갱신 모드 (카운트다운 포함, use_parallel=None이면 GIL 상태로 자동 결정)"""
         # 터미널 설정 저장
         old_settings = None
         is_terminal = sys.stdin.isatty()
@@ -710,142 +1130,142 @@ class FreeThreadingPortMonitor:
                 is_terminal = False
 
         try:
-            hidden_pids = set()
-            last_update = 0
-            countdown = interval
+            # 루프에서 반복 조회되는 속성을 지역 변수로 고정 (LOAD_ATTR 감소)
+            get_open_ports = functools.partial(self.get_open_ports, use_parallel)
+            kill_process = self.kill_process
+            display = self.display_ports_with_actions
+            get_multi_char_input = self.get_multi_char_input
+            cprint = console.print
+            sleep = time.sleep
+            monotonic = time.monotonic
+            write = sys.stdout.write
+            flush = sys.stdout.flush
+            isdigit = str.isdigit
+            after_action = functools.partial(self._after_action, use_parallel=use_parallel)
+            redisplay = self._redisplay
+
+            # stdin 또는 타임아웃 중 먼저 오는 이벤트에서 깨어남 (Linux: epoll)
+            selector = self._selector if is_terminal else None
+
+            hidden_pids: Set[int] = set()
 
             # 초기 화면 표시
-            ports_info, _ = self.get_open_ports()
-            visible_ports = [p for p in ports_info if p["pid"] not in hidden_pids]
+            self.ports_info, _ = get_open_ports()
+            visible_ports: List[Dict] = [p for p in self.ports_info if p["pid"] not in hidden_pids]
             if visible_ports or not hidden_pids:
-                self.display_ports_with_actions(visible_ports)
-                last_update = time.time()
+                visible_ports = display(visible_ports)
+            # 다음 갱신 시각 (카운트다운은 이 값에서 계산하므로 오차가 누적되지 않음)
+            next_refresh = monotonic() + interval
 
             while True:
-                current_time = time.time()
+                remaining = next_refresh - monotonic()
 
                 # 갱신 시간 체크
-                if current_time - last_update >= interval:
-                    ports_info, _ = self.get_open_ports()
-                    visible_ports = [p for p in ports_info if p["pid"] not in hidden_pids]
+                if remaining <= 0:
+                    self.ports_info, _ = get_open_ports()
+                    visible_ports = [p for p in self.ports_info if p["pid"] not in hidden_pids]
 
                     if not visible_ports and not hidden_pids:
-                        console.print(
+                        cprint(
                             f"[yellow]No ports found in range {self.port_range[0]}-{self.port_range[1]}[/yellow]"
                         )
-                        time.sleep(2)
+                        sleep(2)
                         continue
 
-                    self.display_ports_with_actions(visible_ports)
-                    last_update = current_time
-                    countdown = interval
+                    visible_ports = display(visible_ports)
+                    next_refresh = monotonic() + interval
+                    remaining = interval
 
                 # 카운트다운 표시 (화면 하단 고정 위치에 표시)
-                if countdown > 0:
-                    # 터미널 크기 가져오기
-                    try:
-                        term_height = os.get_terminal_size().lines
-                    except:
-                        term_height = 24  # 기본값
-                    # 커서를 화면 맨 아래줄로 이동하고 줄 지우기
-                    sys.stdout.write(f"\033[{term_height};1H")  # 마지막 줄로 이동
-                    sys.stdout.write("\033[K")  # 줄 지우기
-                    sys.stdout.write(f"[{countdown}s] No.=kill | h=hide | r=refresh | q=quit")
-                    sys.stdout.flush()
-                    countdown -= 1
-
-                # 입력 체크 (터미널 환경에서만)
+                countdown = math.ceil(remaining)
+                # 터미널 크기 가져오기
+                try:
+                    term_height = os.get_terminal_size().lines
+                except:
+                    term_height = 24  # 기본값
+                # 커서를 화면 맨 아래줄로 이동하고 줄 지우기
+                write(f"\033[{term_height};1H")  # 마지막 줄로 이동
+                write("\033[K")  # 줄 지우기
+                write(f"[{countdown}s] No.=kill | h=hide | r=refresh | q=quit")
+                flush()
+
+                # 카운트다운 숫자가 바뀌는 시점까지 입력 대기 (터미널 환경에서만)
+                timeout = remaining - (countdown - 1)
                 user_input = None
-                if is_terminal:
-                    user_input = self.get_non_blocking_input(1)
+                if selector is not None:
+                    if selector.select(timeout):
+                        user_input = self.read_stdin_char()
                 else:
-                    time.sleep(1)
+                    sleep(timeout)
 
                 if user_input:
                     if user_input.lower() == "q":
-                        console.print("\n[yellow]Exiting...[/yellow]")
+                        cprint("\n[yellow]Exiting...[/yellow]")
                         break
                     elif user_input.lower() == "r":
                         # 즉시 갱신
-                        ports_info, _ = self.get_open_ports()
-                        visible_ports = [p for p in ports_info if p["pid"] not in hidden_pids]
-                        self.display_ports_with_actions(visible_ports)
-                        last_update = time.time()
-                        countdown = interval
+                        visible_ports, next_refresh = after_action(hidden_pids, interval)
                     elif user_input.lower() == "h":
                         # Hide 모드
-                        sys.stdout.write("\r\033[K")
-                        sys.stdout.flush()
+                        write("\r\033[K")
+                        flush()
 
                         if is_terminal:
-                            hide_input = self.get_multi_char_input(
+                            hide_input = get_multi_char_input(
                                 "Hide process No. (press Enter to confirm, ESC to cancel): "
                             )
-                            if hide_input and hide_input.isdigit():
+                            if hide_input and isdigit(hide_input):
                                 hide_idx = int(hide_input) - 1
                                 if 0 <= hide_idx < len(visible_ports):
-                                    sorted_ports = sorted(visible_ports, key=lambda x: x["port"])
-                                    pid_to_hide = sorted_ports[hide_idx]["pid"]
+                                    pid_to_hide = visible_ports[hide_idx]["pid"]
                                     if pid_to_hide:
                                         hidden_pids.add(pid_to_hide)
-                                        port_num = sorted_ports[hide_idx]["port"]
-                                        proj = sorted_ports[hide_idx]["project_folder"]
-                                        console.print(
+                                        port_num = visible_ports[hide_idx]["port"]
+                                        proj = visible_ports[hide_idx]["project_folder"]
+                                        cprint(
                                             f"\n[yellow]✓ Hidden: No.{hide_idx+1} - {proj} (Port {port_num}, PID {pid_to_hide})[/yellow]"
                                         )
-                                        time.sleep(1)
+                                        sleep(1)
                                     else:
-                                        console.print(f"\n[red]No PID found[/red]")
-                                        time.sleep(1)
+                                        cprint(f"\n[red]No PID found[/red]")
+                                        sleep(1)
                                 else:
-                                    console.print(
+                                    cprint(
                                         f"\n[red]Invalid: {hide_input} (range: 1-{len(visible_ports)})[/red]"
                                     )
-                                    time.sleep(1)
-
-                        # 갱신
-                        ports_info, _ = self.get_open_ports()
-                        visible_ports = [p for p in ports_info if p["pid"] not in hidden_pids]
-                        self.display_ports_with_actions(visible_ports)
-                        countdown = interval
-                    elif user_input.isdigit():
+                                    sleep(1)
+
+                        # 화면만 갱신 (숨김은 데이터 변화가 없으므로 재조회 불필요)
+                        visible_ports = redisplay(hidden_pids)
+                    elif isdigit(user_input):
                         # Kill 모드 - 숫자 입력 시작됨, 즉시 나머지 입력 받기
-                        sys.stdout.write("\r\033[K")
-                        sys.stdout.flush()
+                        write("\r\033[K")
+                        flush()
 
                         if is_terminal:
                             # 첫 숫자 표시하고 나머지 즉시 입력받기
-                            full_input = self.get_multi_char_input(
+                            full_input = get_multi_char_input(
                                 f"Kill process No. (press Enter to confirm, ESC to cancel): {user_input}"
                             )
 
                             # ESC 취소 처리 (None 반환)
                             if full_input is None:
-                                ports_info, _ = self.get_open_ports()
-                                visible_ports = [
-                                    p for p in ports_info if p["pid"] not in hidden_pids
-                                ]
-                                self.display_ports_with_actions(visible_ports)
-                                countdown = interval
+                                visible_ports = redisplay(hidden_pids)
                                 continue
 
                             # 명령어 문자 처리
                             if full_input and full_input.isalpha():
                                 if full_input.lower() == "q":
-                                    console.print("\n[yellow]Exiting...[/yellow]")
+                                    cprint("\n[yellow]Exiting...[/yellow]")
                                     break
                                 elif full_input.lower() == "r":
-                                    ports_info, _ = self.get_open_ports()
-                                    visible_ports = [
-                                        p for p in ports_info if p["pid"] not in hidden_pids
-                                    ]
-                                    self.display_ports_with_actions(visible_ports)
-                                    last_update = time.time()
-                                    countdown = interval
+                                    visible_ports, next_refresh = after_action(
+                                        hidden_pids, interval
+                                    )
                                     continue
 
                             # 숫자 조합 (full_input이 빈 문자열이면 user_input만 사용)
-                            if full_input and full_input.isdigit():
+                            if full_input and isdigit(full_input):
                                 kill_input = user_input + full_input
                             else:
                                 kill_input = user_input  # 한자리수 입력 + Enter 경우
@@ -853,56 +1273,38 @@ class FreeThreadingPortMonitor:
                             kill_input = user_input
 
                         # 프로세스 종료 처리
-                        if kill_input and kill_input.isdigit():
+                        if kill_input and isdigit(kill_input):
                             idx = int(kill_input) - 1
                             if 0 <= idx < len(visible_ports):
-                                sorted_ports = sorted(visible_ports, key=lambda x: x["port"])
-                                selected = sorted_ports[idx]
+                                selected = visible_ports[idx]
 
                                 if selected["pid"]:
-                                    console.print(
+                                    cprint(
                                         f"\n[yellow]Killing No.{idx+1}: {selected['project_folder']} (Port {selected['port']}, PID {selected['pid']})[/yellow]"
                                     )
-                                    if self.kill_process(selected["pid"]):
-                                        console.print(
-                                            f"[green]✓ Process {selected['pid']} killed[/green]"
-                                        )
-                                    time.sleep(1)
+                                    if kill_process(selected["pid"]):
+                                        cprint(f"[green]✓ Process {selected['pid']} killed[/green]")
+                                    sleep(1)
 
                                     # 갱신
-                                    ports_info, _ = self.get_open_ports()
-                                    visible_ports = [
-                                        p for p in ports_info if p["pid"] not in hidden_pids
-                                    ]
-                                    self.display_ports_with_actions(visible_ports)
-                                    last_update = time.time()
-                                    countdown = interval
-                                else:
-                                    console.print(
-                                        f"\n[red]No PID for port {selected['port']}[/red]"
+                                    visible_ports, next_refresh = after_action(
+                                        hidden_pids, interval
                                     )
-                                    time.sleep(1)
-                                    ports_info, _ = self.get_open_ports()
-                                    visible_ports = [
-                                        p for p in ports_info if p["pid"] not in hidden_pids
-                                    ]
-                                    self.display_ports_with_actions(visible_ports)
-                                    countdown = interval
+                                else:
+                                    cprint(f"\n[red]No PID for port {selected['port']}[/red]")
+                                    sleep(1)
+                                    visible_ports = redisplay(hidden_pids)
                             else:
-                                console.print(
+                                cprint(
                                     f"\n[red]Invalid: {kill_input} (range: 1-{len(visible_ports)})[/red]"
                                 )
-                                time.sleep(1)
-                                ports_info, _ = self.get_open_ports()
-                                visible_ports = [
-                                    p for p in ports_info if p["pid"] not in hidden_pids
-                                ]
-                                self.display_ports_with_actions(visible_ports)
-                                countdown = interval
+                                sleep(1)
+                                visible_ports = redisplay(hidden_pids)
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Interrupted by user[/yellow]")
         finally:
+            self.close_selector()
             # 터미널 설정 복원
             if old_settings:
                 try:
@@ -943,10 +1345,6 @@ def main():
 
     try:
         if args.benchmark:
-            # 먼저 한 번 표시
-            ports_info, elapsed = monitor.get_open_ports()
-            monitor.display_ports_with_actions(ports_info)
-            console.print(f"\n[bold]포트 정보 수집 시간:[/bold] {elapsed:.3f}초\n")
             # 벤치마크 실행
             monitor.benchmark_comparison()
         else:
@@ -958,7 +1356,7 @@ def main():
                 use_parallel = False
 
             # 자동 갱신 모니터링
-            monitor.quick_view(interval=args.interval)
+            monitor.quick_view(interval=args.interval, use_parallel=use_parallel)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
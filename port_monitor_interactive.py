@@ -4,90 +4,325 @@
 자동 갱신 중에도 프로세스 kill 가능
 """
 
-import subprocess
-import re
 import os
 import sys
+import math
 import psutil
 import signal
+import pwd
+import socket
 import select
+import selectors
 import termios
 import tty
-from typing import List, Dict, Optional
-from pathlib import Path
-from rich.console import Console
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple
+from rich.console import Console, Group
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
+from rich.text import Text
 import time
 import threading
 
 console = Console()
 
+# /proc 직접 읽기 가능 여부 (Linux)
+HAS_PROCFS = os.path.isdir('/proc/self')
+
+# /proc/<pid>/stat의 rss(페이지 수)를 바이트로 바꿀 때 사용
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# UID -> 사용자명 캐시 (passwd 조회는 프로세스마다 반복할 필요 없음)
+_username_cache: Dict[int, str] = {}
+
+
+def _read_proc_file(path: str, bufsize: int = 65536, until_eof: bool = False) -> bytes:
+    """작은 /proc 파일을 raw fd로 읽기 (내장 open()의 버퍼/디코딩/fstat 생략)
+
+    /proc/<pid>/stat, status, cmdline 같은 단일 레코드 파일은 한 번의 read로 전체 내용을
+    돌려주므로 버퍼를 가득 채운 경우에만 이어서 읽는다 (EOF 확인용 빈 read 생략).
+    /proc/net/tcp 같은 여러 레코드 seq_file은 read 한 번에 약 한 페이지만 돌려주므로
+    until_eof=True로 빈 값이 나올 때까지 읽어야 한다.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        data = os.read(fd, bufsize)
+        if not until_eof and len(data) < bufsize:
+            return data
+        if not data:
+            return data
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, bufsize)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+# (파일, 프로토콜, 표시 상태, 대상 st 값) - TCP는 LISTEN(0A), UDP는 연결 안 된 소켓(07)
+_PROC_NET_FILES = (
+    ('/proc/net/tcp', 'tcp', 'LISTEN', b'0A'),
+    ('/proc/net/tcp6', 'tcp', 'LISTEN', b'0A'),
+    ('/proc/net/udp', 'udp', 'UNCONN', b'07'),
+    ('/proc/net/udp6', 'udp', 'UNCONN', b'07'),
+)
+
+
+def _read_proc_net_sockets(start_port: int, end_port: int) -> List[Tuple[str, str, int, int]]:
+    """/proc/net/{tcp,udp}[6]에서 범위 내 리스닝 소켓을 (프로토콜, 상태, 포트, inode)로 반환
+
+    각 파일은 EOF까지 읽고 bytes 그대로 필드를 잘라 본다 (psutil 객체 생성 없음).
+    """
+    sockets = []
+    for path, protocol, state, st_value in _PROC_NET_FILES:
+        try:
+            # seq_file이라 read 한 번에 한 페이지 정도만 오므로 EOF까지 읽음
+            data = _read_proc_file(path, until_eof=True)
+        except OSError:
+            continue
+        # 첫 줄은 헤더
+        for line in data.splitlines()[1:]:
+            fields = line.split()
+            if len(fields) < 10 or fields[3] != st_value:
+                continue
+            # UDP는 상대 주소가 없는(포트 0) 소켓만 (ss의 UNCONN)
+            if protocol == 'udp' and not fields[2].endswith(b':0000'):
+                continue
+            port = int(fields[1][fields[1].rindex(b':') + 1:], 16)
+            if start_port <= port <= end_port:
+                sockets.append((protocol, state, port, int(fields[9])))
+    return sockets
+
+
+def _map_socket_inodes_to_pids(inodes: set) -> Dict[int, int]:
+    """/proc/<pid>/fd를 한 번 훑어 소켓 inode -> PID 매핑 (찾을 inode를 모두 찾으면 중단)
+
+    권한이 없는 프로세스의 fd는 건너뛰므로 해당 소켓의 PID는 알 수 없다.
+    """
+    inode_to_pid: Dict[int, int] = {}
+    if not inodes:
+        return inode_to_pid
+    remaining = set(inodes)
+    with os.scandir('/proc') as proc_entries:
+        for proc_entry in proc_entries:
+            if not proc_entry.name.isdigit():
+                continue
+            pid = int(proc_entry.name)
+            try:
+                with os.scandir(f'/proc/{pid}/fd') as fd_entries:
+                    for fd_entry in fd_entries:
+                        try:
+                            target = os.readlink(fd_entry.path)
+                        except OSError:
+                            continue
+                        # 소켓 fd는 'socket:[inode]' 형태
+                        if not target.startswith('socket:['):
+                            continue
+                        inode = int(target[8:-1])
+                        if inode in remaining:
+                            remaining.discard(inode)
+                            inode_to_pid[inode] = pid
+            except OSError:
+                # 권한 없음 또는 조회 중 종료된 프로세스
+                continue
+            if not remaining:
+                break
+    return inode_to_pid
+
+
+def _username_for_uid(uid: int) -> str:
+    """UID를 사용자명으로 변환 (없는 UID는 숫자 그대로)"""
+    name = _username_cache.get(uid)
+    if name is None:
+        try:
+            name = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            name = str(uid)
+        _username_cache[uid] = name
+    return name
+
+
 class InteractivePortMonitor:
+    # 상태 메시지(토스트)를 footer에 보여주는 시간(초)
+    TOAST_SECONDS = 2
+    # 카운트다운 줄에서 숫자 뒤에 붙는 고정 안내 문구
+    FOOTER_HINT = "No.=kill | h=hide | u=unhide | r=refresh | q=quit"
+    # cwd -> 프로젝트 폴더명 캐시 최대 크기 (넘으면 가장 먼저 넣은 항목부터 제거)
+    FOLDER_CACHE_SIZE = 256
+    # (셀 문자열, 스타일) -> Text 캐시 최대 크기
+    TEXT_CACHE_SIZE = 512
+    # 모드(모바일 여부)별 테이블 컬럼 정의 (헤더, add_column 인자) - 갱신마다 이 값으로 새 Table 생성
+    TABLE_COLUMNS = {
+        # 모바일 모드: No., Port, Project, Memory 표시
+        True: (
+            ("No.", {'style': "bold white", 'width': 3}),
+            ("Port", {'style': "cyan", 'width': 5}),
+            ("Project", {'style': "bold green"}),
+            ("Mem", {'style': "red", 'width': 6}),
+        ),
+        # PC 모드: 전체 정보 표시
+        False: (
+            ("No.", {'style': "bold white", 'min_width': 3, 'no_wrap': True}),
+            ("PID", {'style': "yellow", 'min_width': 8, 'no_wrap': True}),
+            ("Port", {'style': "cyan", 'min_width': 5, 'no_wrap': True}),
+            ("Project Folder", {'style': "bold green", 'width': 30}),
+            ("Process", {'style': "blue", 'width': 18, 'no_wrap': True, 'overflow': "ellipsis"}),
+            ("Memory", {'style': "red", 'width': 10}),
+            ("User", {'style': "magenta", 'width': 10}),
+        ),
+    }
+
     def __init__(self, start_port=443, end_port=9000):
         self.port_range = (start_port, end_port)
-        # sudo 비밀번호는 환경변수 SUDO_PASSWORD에서 가져오기
-        self.sudo_password = os.getenv('SUDO_PASSWORD', '')
         self.running = True
         self.ports_info = []
         self.hidden_ports = set()  # 숨긴 포트 목록
+        # 숨긴 포트를 뺀 포트번호순 목록 (화면의 No. 순서와 같음)
+        # ports_info 갱신 또는 hidden_ports 변경 시에만 다시 계산
+        self._sorted_visible: List[Dict] = []
+        # 화면 No.(0부터) -> 포트 번호, 포트 번호 -> 포트 정보 (h/s 처리 시 O(1) 조회)
+        self._ports_by_idx: List[int] = []
+        self._port_map: Dict[int, Dict] = {}
+        # PID -> (프로세스 시작 시각, cwd/cmdline/user/이름) 캐시, 갱신 사이에도 유지
+        self._proc_cache: Dict[int, Tuple[float, Dict]] = {}
+        # cwd -> 프로젝트 폴더명 (같은 cwd는 갱신마다 다시 자르지 않음)
+        self._folder_cache: Dict[str, str] = {}
+        # 화면 레이아웃: 포트 목록(main) + 맨 아래 카운트다운/메시지 한 줄(footer)
+        self._layout = Layout()
+        self._layout.split_column(Layout(name='main'), Layout(name='footer', size=1))
+        self._live: Optional[Live] = None
+        # 헤더 패널 (포트 범위는 바뀌지 않으므로 한 번만 생성)
+        self._header = Panel(f"🔄 Port Monitor ({start_port}-{end_port})", style="bold cyan")
+        # (셀 문자열, 스타일) -> Text (갱신마다 markup을 다시 파싱하지 않음)
+        self._cell_texts: Dict[Tuple[str, str], Text] = {}
+        # 수집 스레드 -> UI 루프 깨우기용 파이프 (새 결과가 나오면 입력 대기를 바로 끝냄)
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        # 수집 스레드의 wakeup()과 close_selector()가 닫힌 fd를 두고 겹치지 않도록 보호
+        self._wakeup_lock = threading.Lock()
+        # stdin + 깨우기 파이프 대기용 셀렉터 (Linux: epoll), 한 번만 등록해 매 호출마다 fd 목록을 만들지 않음
+        self._selector: Optional[selectors.BaseSelector] = None
+        try:
+            selector = selectors.DefaultSelector()
+            try:
+                selector.register(sys.stdin, selectors.EVENT_READ)
+                selector.register(self._wakeup_r, selectors.EVENT_READ)
+            except (ValueError, OSError):
+                # 일반 파일/닫힌 stdin 등 epoll 등록 불가 → select.select로 대체
+                selector.close()
+            else:
+                self._selector = selector
+        except OSError:
+            pass
+        if self._selector is None:
+            # 셀렉터가 없으면 파이프를 읽을 곳도 없음
+            self.close_selector()
+        # 카운트다운 줄 전체가 화면에 그려져 있는 줄 번호 (None이면 다음 틱에 전체를 다시 씀)
+        self._countdown_row: Optional[int] = None
+        # 마지막으로 화면에 쓴 카운트다운 숫자 (같으면 다시 쓰지 않음)
+        self._countdown_shown: Optional[int] = None
+        # 백그라운드 수집 스레드 <-> UI 루프 신호
+        self._refresh_event = threading.Event()  # 새 포트 정보 준비됨
+        self._collect_now = threading.Event()  # 즉시 수집 요청 (r, kill 후)
+        self._pending_ports: List[Dict] = []
+        self._collector: Optional[threading.Thread] = None
+        # 다음 루프에서 화면을 다시 그려야 하는지 (키 입력마다 바로 그리지 않고 모아서 한 번)
+        self._needs_redraw = False
+        # 마지막으로 그린 화면 내용의 서명 (같은 데이터면 다시 그리지 않음)
+        self._last_sig: Optional[int] = None
+        # footer에 떠 있는 상태 메시지 (만료 시각 time.monotonic, 메시지), 없으면 None
+        self._toast: Optional[Tuple[float, str]] = None
         
+    def list_listening_ports(self) -> List[Dict]:
+        """범위 내 리스닝 소켓 수집 (ss -tuln과 같은 대상)
+
+        /proc/net/tcp*, udp*를 직접 파싱하고 찾은 소켓 inode만 PID로 매핑한다.
+        /proc이 없으면 psutil.net_connections()를 사용한다.
+        다른 사용자 프로세스의 PID까지 보려면 sudo로 실행하거나
+        CAP_SYS_PTRACE 권한이 필요하다 (README 참고).
+        """
+        start_port, end_port = self.port_range
+        basic_ports_info = []
+
+        if HAS_PROCFS:
+            sockets = _read_proc_net_sockets(start_port, end_port)
+            inode_to_pid = _map_socket_inodes_to_pids({inode for *_, inode in sockets if inode})
+            for protocol, state, port, inode in sockets:
+                basic_ports_info.append({
+                    'protocol': protocol,
+                    'state': state,
+                    'port': port,
+                    'pid': inode_to_pid.get(inode),
+                    'process_name': None  # 프로세스 상세 조회 시 채움
+                })
+            return basic_ports_info
+
+        for conn in psutil.net_connections(kind='inet'):
+            if not conn.laddr or not start_port <= conn.laddr.port <= end_port:
+                continue
+
+            if conn.type == socket.SOCK_STREAM:
+                if conn.status != psutil.CONN_LISTEN:
+                    continue
+                protocol, state = 'tcp', 'LISTEN'
+            else:
+                # 연결되지 않은 UDP 소켓 (ss의 UNCONN)
+                if conn.raddr:
+                    continue
+                protocol, state = 'udp', 'UNCONN'
+
+            basic_ports_info.append({
+                'protocol': protocol,
+                'state': state,
+                'port': conn.laddr.port,
+                'pid': conn.pid,
+                'process_name': None  # 프로세스 상세 조회 시 채움
+            })
+
+        return basic_ports_info
+
     def get_open_ports(self) -> List[Dict]:
         """열려있는 포트 정보 수집"""
         try:
-            cmd = f"echo '{self.sudo_password}' | sudo -S ss -tulnp '( sport >= :{self.port_range[0]} and sport <= :{self.port_range[1]} )'"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            ports_info = []
+            basic_ports_info = self.list_listening_ports()
             
-            if result.returncode != 0:
-                return []
+            # 더 이상 포트를 열고 있지 않은 PID는 캐시에서 제거
+            live_pids = {info['pid'] for info in basic_ports_info if info['pid']}
+            for pid in self._proc_cache.keys() - live_pids:
+                del self._proc_cache[pid]
             
-            ports_info = []
-            lines = result.stdout.strip().split('\n')[1:]
+            # 숨긴 포트는 화면에 나오지 않으므로 프로세스 상세 조회 생략
+            # (수집 스레드에서 읽으므로 UI 스레드가 바꾸는 set 대신 복사본 사용)
+            hidden_ports = frozenset(self.hidden_ports)
             
-            for line in lines:
-                if not line.strip() or '[sudo]' in line:
-                    continue
-                    
-                parts = line.split()
-                if len(parts) < 6:
-                    continue
-                
-                # 포트 정보 파싱
-                local_addr = parts[4]
-                port_match = re.search(r':(\d+)$', local_addr)
-                if not port_match:
-                    continue
-                    
-                port = int(port_match.group(1))
-                
-                # PID 추출
-                pid_match = re.search(r'pid=(\d+)', line)
-                pid = int(pid_match.group(1)) if pid_match else None
-                
-                # 프로세스 이름 추출
-                process_match = re.search(r'"([^"]+)"', line)
-                process_name = process_match.group(1) if process_match else "Unknown"
+            for basic_info in basic_ports_info:
+                pid = basic_info['pid']
                 
                 # 프로세스 상세 정보
-                process_info = self.get_process_details(pid) if pid else {}
+                if pid and basic_info['port'] not in hidden_ports:
+                    process_info = self.get_process_details(pid)
+                else:
+                    process_info = {}
                 
                 # 프로젝트 폴더 추출
                 project_folder = self.extract_project_folder(process_info.get('cwd', ''))
                 
                 ports_info.append({
-                    'protocol': parts[0],
-                    'state': parts[1], 
-                    'port': port,
-                    'pid': pid,
-                    'process_name': process_name,
+                    **basic_info,
+                    'process_name': basic_info['process_name'] or process_info.get('name', 'Unknown'),
                     'project_folder': project_folder,
                     'cwd': process_info.get('cwd', 'Unknown'),
                     'cmdline': process_info.get('cmdline', ''),
-                    'memory': process_info.get('memory', 'N/A'),
-                    'cpu': process_info.get('cpu', 'N/A'),
+                    # 숫자 그대로 보관 (문자열 변환은 화면에 그릴 때만, None = 알 수 없음)
+                    'rss_mb': process_info.get('rss_mb'),
                     'user': process_info.get('user', 'N/A')
                 })
             
@@ -96,46 +331,224 @@ class InteractivePortMonitor:
         except Exception as e:
             return []
     
+    def collector_loop(self, interval: int):
+        """interval마다 포트 정보 수집 (수집 스레드, UI 입력/카운트다운을 막지 않음)"""
+        while self.running:
+            self._pending_ports = self.get_open_ports()
+            self._refresh_event.set()
+            self.wakeup()
+            # interval 동안 대기하되 즉시 수집 요청이 오면 바로 깨어남
+            self._collect_now.wait(interval)
+            self._collect_now.clear()
+
+    def start_collector(self, interval: int):
+        """백그라운드 수집 스레드 시작"""
+        self._collector = threading.Thread(target=self.collector_loop, args=(interval,),
+                                           name='port-collector', daemon=True)
+        self._collector.start()
+
+    def stop_collector(self):
+        """수집 스레드에 종료 신호 (daemon이라 진행 중인 수집은 기다리지 않음)"""
+        self.running = False
+        self._collect_now.set()
+
+    def wakeup(self):
+        """입력 대기 중인 UI 루프를 깨움 (셀렉터가 없거나 이미 신호가 쌓여 있으면 무시)"""
+        with self._wakeup_lock:
+            if self._selector is None:
+                return
+            try:
+                os.write(self._wakeup_w, b'\0')
+            except BlockingIOError:
+                pass
+
+    def close_selector(self):
+        """입력 셀렉터와 깨우기 파이프 닫기 (여러 번 호출해도 안전)"""
+        with self._wakeup_lock:
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            if self._wakeup_w is not None:
+                os.close(self._wakeup_r)
+                os.close(self._wakeup_w)
+                self._wakeup_r = self._wakeup_w = None
+
+    def request_refresh(self):
+        """다음 주기를 기다리지 않고 바로 수집하도록 요청"""
+        self._collect_now.set()
+
+    def apply_pending_ports(self) -> bool:
+        """수집 스레드가 준비한 결과가 있으면 반영 (UI 스레드에서 호출)"""
+        if not self._refresh_event.is_set():
+            return False
+        self._refresh_event.clear()
+        self.ports_info = self._pending_ports
+        self.update_visible_ports()
+        return True
+
+    def update_visible_ports(self):
+        """숨긴 포트를 제외하고 포트번호순으로 정렬한 목록과 조회용 인덱스를 다시 계산"""
+        self._sorted_visible = sorted(
+            (p for p in self.ports_info if p['port'] not in self.hidden_ports),
+            key=itemgetter('port')
+        )
+        self._ports_by_idx = [p['port'] for p in self._sorted_visible]
+        self._port_map = {p['port']: p for p in self.ports_info}
+
+    def visible_signature(self) -> int:
+        """화면에 보이는 내용(포트, PID, 표시되는 메모리 값)의 서명"""
+        return hash(tuple(
+            (p['port'], p['pid'], round(p['rss_mb'], 1) if p['rss_mb'] is not None else None)
+            for p in self._sorted_visible
+        ))
+
     def get_process_details(self, pid: int) -> Dict:
-        """PID로 프로세스 상세 정보 가져오기"""
+        """PID로 프로세스 상세 정보 가져오기 (/proc 직접 읽기, psutil 객체 생성 없음)
+
+        캐시된 PID는 /proc/<pid>/stat 하나만 읽고(시작 시각 + RSS),
+        cwd/cmdline/user/이름은 (PID, 시작 시각)이 같으면 캐시를 재사용한다.
+        캐시가 없을 때 이름은 stat의 comm을 쓰고, 사용자는 status의 실제 UID로 구한다.
+        """
+        if not HAS_PROCFS:
+            return self.get_process_details_psutil(pid)
+
+        proc_dir = f'/proc/{pid}'
         try:
-            process = psutil.Process(pid)
-            cmdline = process.cmdline()
-            if len(cmdline) > 3:
-                cmdline_str = ' '.join(cmdline[:3]) + '...'
+            # stat의 comm 필드에 공백/괄호가 있을 수 있어 마지막 ')' 이후만 분리
+            # (분리 후 인덱스 19 = starttime / 21 = rss(페이지))
+            stat_head, _, stat_tail = _read_proc_file(f'{proc_dir}/stat').rpartition(b')')
+            stat_fields = stat_tail.split()
+            start_time = int(stat_fields[19])
+            rss_bytes = int(stat_fields[21]) * PAGE_SIZE
+
+            cached = self._proc_cache.get(pid)
+            # 시작 시각이 다르면 같은 번호로 재사용된 다른 프로세스
+            if cached is not None and cached[0] == start_time:
+                static_info = cached[1]
             else:
-                cmdline_str = ' '.join(cmdline)
+                # "pid (comm" 부분의 comm = status의 Name과 같은 값 (최대 15자)
+                name = stat_head.partition(b'(')[2].decode(errors='replace')
+                # 실제 UID는 status의 Uid: 첫 값 (/proc/<pid> 소유자는 dumpable이 아닌
+                # 프로세스에서 root로 바뀌므로 사용하지 않음, 캐시 미스 때만 읽음)
+                uid = None
+                for line in _read_proc_file(f'{proc_dir}/status').splitlines():
+                    if line.startswith(b'Uid:'):
+                        uid = int(line.split()[1])
+                        break
+                cmdline = [arg.decode(errors='replace')
+                           for arg in _read_proc_file(f'{proc_dir}/cmdline').split(b'\0') if arg]
+                if len(cmdline) > 3:
+                    cmdline_str = ' '.join(cmdline[:3]) + '...'
+                else:
+                    cmdline_str = ' '.join(cmdline)
+                try:
+                    cwd = os.readlink(f'{proc_dir}/cwd')
+                except PermissionError:
+                    # 다른 사용자 프로세스의 cwd는 root가 아니면 읽을 수 없음
+                    cwd = 'Unknown'
+                static_info = {
+                    'name': name or 'Unknown',
+                    'cwd': cwd,
+                    'cmdline': cmdline_str,
+                    'user': _username_for_uid(uid) if uid is not None else 'N/A'
+                }
+                self._proc_cache[pid] = (start_time, static_info)
+
+            return {
+                **static_info,
+                'rss_mb': rss_bytes / 1048576.0
+            }
+        except (OSError, ValueError, IndexError):
+            # 프로세스 종료(FileNotFoundError/ProcessLookupError) 등
+            self._proc_cache.pop(pid, None)
+            return {}
+
+    def get_process_details_psutil(self, pid: int) -> Dict:
+        """psutil로 프로세스 상세 정보 가져오기 (/proc이 없는 환경용)"""
+        try:
+            process = psutil.Process(pid)
+            # oneshot: /proc/<pid>/stat, status를 한 번만 읽고 아래 호출들이 공유
+            with process.oneshot():
+                create_time = process.create_time()
+                memory_info = process.memory_info()
+
+                cached = self._proc_cache.get(pid)
+                # 시작 시각이 다르면 같은 번호로 재사용된 다른 프로세스
+                if cached is not None and cached[0] == create_time:
+                    static_info = cached[1]
+                else:
+                    cmdline = process.cmdline()
+                    if len(cmdline) > 3:
+                        cmdline_str = ' '.join(cmdline[:3]) + '...'
+                    else:
+                        cmdline_str = ' '.join(cmdline)
+                    static_info = {
+                        'name': process.name(),
+                        'cmdline': cmdline_str,
+                        'user': process.username()
+                    }
+                    cached = None
+
+            if cached is None:
+                # cwd는 readlink라 oneshot 캐시 대상이 아님
+                static_info['cwd'] = process.cwd()
+                self._proc_cache[pid] = (create_time, static_info)
             
             return {
-                'cwd': process.cwd(),
-                'cmdline': cmdline_str,
-                'memory': f"{process.memory_info().rss / 1024 / 1024:.1f}MB",
-                'cpu': f"{process.cpu_percent():.1f}%",
-                'user': process.username()
+                **static_info,
+                'rss_mb': memory_info.rss / 1048576.0
             }
         except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._proc_cache.pop(pid, None)
             return {}
     
     def extract_project_folder(self, cwd: str) -> str:
-        """CWD에서 프로젝트 폴더명 추출"""
+        """CWD에서 프로젝트 폴더명 추출 (같은 cwd는 캐시된 결과 사용)"""
+        folder = self._folder_cache.get(cwd)
+        if folder is None:
+            if len(self._folder_cache) >= self.FOLDER_CACHE_SIZE:
+                del self._folder_cache[next(iter(self._folder_cache))]
+            folder = self._folder_cache[cwd] = self.compute_project_folder(cwd)
+        return folder
+
+    def compute_project_folder(self, cwd: str) -> str:
+        """CWD에서 프로젝트 폴더명 계산 (캐시 없이)"""
         if cwd == 'Unknown' or not cwd:
             return 'Unknown'
         
-        if '/DEVEL/' in cwd:
-            parts = cwd.split('/DEVEL/')
-            if len(parts) > 1:
-                project_parts = parts[1].split('/')
-                if project_parts[0]:
-                    return project_parts[0]
+        # DEVEL 디렉토리 다음의 폴더명 (partition: 중간 리스트 없이 한 번만 훑음)
+        _, sep, tail = cwd.partition('/DEVEL/')
+        if sep:
+            project = tail.partition('/')[0]
+            if project:
+                return project
         
-        return Path(cwd).name if cwd else 'Unknown'
+        # 마지막 경로 요소 (Path(cwd).name과 같음, Path 객체 생성 없이)
+        return cwd.rstrip('/').rpartition('/')[2]
     
-    def display_ports_with_actions(self, ports_info: List[Dict]):
-        """포트 정보를 테이블로 표시 (모바일 자동 감지)"""
-        # ANSI escape: 화면 지우고 커서를 맨 위로 이동 (tmux 호환)
-        sys.stdout.write('\033[2J\033[H')
-        sys.stdout.flush()
+    def get_ports_table(self, is_mobile: bool) -> Table:
+        """모드별 빈 포트 테이블 생성 (컬럼 정의는 TABLE_COLUMNS를 그대로 사용)"""
+        table = Table(show_header=True, header_style="bold magenta")
+        for header, options in self.TABLE_COLUMNS[is_mobile]:
+            table.add_column(header, **options)
+        return table
 
+    def get_cell_text(self, value: str, style: str = "") -> Text:
+        """테이블 셀 Text (같은 문자열/스타일은 만들어 둔 Text 재사용, markup 파싱 없음)"""
+        key = (value, style)
+        text = self._cell_texts.get(key)
+        if text is None:
+            if len(self._cell_texts) >= self.TEXT_CACHE_SIZE:
+                del self._cell_texts[next(iter(self._cell_texts))]
+            text = self._cell_texts[key] = Text(value, style=style)
+        return text
+
+    def display_ports_with_actions(self):
+        """포트 정보를 테이블로 표시 (모바일 자동 감지)
+
+        Live 화면이 켜져 있으면 레이아웃의 main 영역만 교체하고,
+        아니면 화면을 지우고 그대로 출력한다.
+        """
         # 터미널 폭 감지하여 모바일/PC 모드 결정
         try:
             term_width = os.get_terminal_size().columns
@@ -144,107 +557,167 @@ class InteractivePortMonitor:
 
         is_mobile = term_width < 80  # 80컬럼 미만이면 모바일 모드
 
+        self._last_sig = self.visible_signature()
+        renderables = []
+
         # 헤더
-        console.print(Panel(f"🔄 Port Monitor ({self.port_range[0]}-{self.port_range[1]})", style="bold cyan"))
+        renderables.append(self._header)
 
         # 현재 시간
         timestamp = time.strftime("%H:%M:%S" if is_mobile else "%Y-%m-%d %H:%M:%S")
-        console.print(f"[dim]{timestamp}[/dim]")
+        renderables.append(f"[dim]{timestamp}[/dim]")
         if not is_mobile:
-            console.print(f"[dim]Usage: Type process No. and press Enter to kill[/dim]")
-        console.print("")
+            renderables.append(f"[dim]Usage: Type process No. and press Enter to kill[/dim]")
+        renderables.append("")
 
-        # 숨긴 포트 제외하고 필터링
-        visible_ports = [p for p in ports_info if p['port'] not in self.hidden_ports]
+        # 숨긴 포트 제외, 포트번호순 (update_visible_ports에서 미리 계산)
+        visible_ports = self._sorted_visible
 
         # 숨긴 포트가 있으면 표시
         if self.hidden_ports:
             if is_mobile:
-                console.print(f"[yellow]Hidden: {len(self.hidden_ports)}[/yellow]")
+                renderables.append(f"[yellow]Hidden: {len(self.hidden_ports)}[/yellow]")
             else:
-                console.print(f"[yellow]Hidden ports: {', '.join(map(str, sorted(self.hidden_ports)))}[/yellow]")
-                console.print(f"[dim]Press 'u' to unhide all, or 's' + number to show specific port[/dim]")
-            console.print("")
+                renderables.append(f"[yellow]Hidden ports: {', '.join(map(str, sorted(self.hidden_ports)))}[/yellow]")
+                renderables.append(f"[dim]Press 'u' to unhide all, or 's' + number to show specific port[/dim]")
+            renderables.append("")
 
         # 테이블 (모바일: 간소화, PC: 전체 정보)
-        table = Table(show_header=True, header_style="bold magenta")
+        table = self.get_ports_table(is_mobile)
 
-        if is_mobile:
-            # 모바일 모드: No., Port, Project, Memory 표시
-            table.add_column("No.", style="bold white", width=3)
-            table.add_column("Port", style="cyan", width=5)
-            table.add_column("Project", style="bold green")
-            table.add_column("Mem", style="red", width=6)
-        else:
-            # PC 모드: 전체 정보 표시
-            table.add_column("No.", style="bold white", min_width=3, no_wrap=True)
-            table.add_column("PID", style="yellow", min_width=8, no_wrap=True)
-            table.add_column("Port", style="cyan", min_width=5, no_wrap=True)
-            table.add_column("Project Folder", style="bold green", width=30)
-            table.add_column("Process", style="blue", width=18)
-            table.add_column("Memory", style="red", width=10)
-            table.add_column("User", style="magenta", width=10)
-
-        for idx, port in enumerate(sorted(visible_ports, key=lambda x: x['port']), 1):
+        cell = self.get_cell_text
+        for idx, port in enumerate(visible_ports, 1):
+            memory_display = cell(f"{port['rss_mb']:.1f}MB" if port['rss_mb'] is not None else "N/A")
             if port['project_folder'] != 'Unknown':
-                folder_display = f"[bold green]{port['project_folder']}[/bold green]"
+                folder_display = cell(port['project_folder'], "bold green")
             else:
-                folder_display = "[dim]Unknown[/dim]"
+                folder_display = cell("Unknown", "dim")
 
             if is_mobile:
                 table.add_row(
-                    str(idx),
-                    str(port['port']),
+                    cell(str(idx)),
+                    cell(str(port['port'])),
                     folder_display,
-                    str(port['memory'])
+                    memory_display
                 )
             else:
                 table.add_row(
-                    str(idx),
-                    str(port['pid']) if port['pid'] else "N/A",
-                    str(port['port']),
+                    cell(str(idx)),
+                    cell(str(port['pid']) if port['pid'] else "N/A"),
+                    cell(str(port['port'])),
                     folder_display,
-                    port['process_name'][:18] if len(port['process_name']) > 18 else port['process_name'],
-                    str(port['memory']),
-                    port['user']
+                    # 18자를 넘는 이름은 컬럼의 overflow="ellipsis"로 잘림
+                    cell(port['process_name']),
+                    memory_display,
+                    cell(port['user'])
                 )
 
-        console.print(table)
+        renderables.append(table)
         if is_mobile:
-            console.print(f"\n[bold]Total:[/bold] {len(visible_ports)}")
+            renderables.append(f"\n[bold]Total:[/bold] {len(visible_ports)}")
         else:
-            console.print(f"\n[bold]Total ports:[/bold] {len(visible_ports)} visible, {len(self.hidden_ports)} hidden")
-        console.print("")  # 카운트다운과 구분을 위한 빈 줄
+            renderables.append(f"\n[bold]Total ports:[/bold] {len(visible_ports)} visible, {len(self.hidden_ports)} hidden")
+        renderables.append("")  # 카운트다운과 구분을 위한 빈 줄
+
+        if self._live is not None:
+            # 화면 전체를 지우지 않고 Live가 main 영역을 다시 그림 (footer는 그대로)
+            self._layout['main'].update(Group(*renderables))
+            self._live.refresh()
+        else:
+            self._countdown_row = None
+            # ANSI escape: 화면 지우고 커서를 맨 위로 이동 (tmux 호환)
+            sys.stdout.write('\033[2J\033[H')
+            sys.stdout.flush()
+            for renderable in renderables:
+                console.print(renderable)
 
         return visible_ports
     
+    def start_live(self):
+        """Live 전체 화면 시작 (자동 갱신 없음, 데이터가 바뀔 때만 다시 그림)"""
+        self._live = Live(self._layout, console=console, screen=True, auto_refresh=False,
+                          redirect_stdout=False, redirect_stderr=False)
+        self._live.start()
+
+    def stop_live(self):
+        """Live 화면 종료 (여러 번 호출해도 안전)"""
+        if self._live is not None:
+            self._live.stop()
+            self._live = None
+
+    def set_countdown(self, countdown: int, width: int):
+        """카운트다운 갱신 - 고정 문구가 이미 그려져 있으면 숫자 칸만 한 번의 write로 덮어씀"""
+        if self._countdown_row is not None and countdown == self._countdown_shown:
+            return
+        self._countdown_shown = countdown
+        text = f"[{countdown:>{width}}s] {self.FOOTER_HINT}"
+        self._layout['footer'].update(Text(text))
+        try:
+            term_height = os.get_terminal_size().lines
+        except:
+            term_height = 24  # 기본값
+        if self._countdown_row == term_height:
+            # 커서 저장 → 맨 아래 줄 2번째 칸으로 이동해 숫자만 출력 → 커서 복원
+            sys.stdout.write(f'\0337\033[{term_height};2H{countdown:>{width}}\0338')
+        else:
+            sys.stdout.write(f'\033[{term_height};1H\033[K{text}')
+            self._countdown_row = term_height
+        sys.stdout.flush()
+
+    def notify(self, message: str):
+        """상태 메시지 표시 (Live 화면에서는 TOAST_SECONDS 동안 footer 줄에, 아니면 현재 위치 아래에 출력)"""
+        if self._live is not None:
+            self._toast = (time.monotonic() + self.TOAST_SECONDS, message)
+            self._countdown_row = None
+            self._layout['footer'].update(Text.from_markup(message))
+            self._live.refresh()
+        else:
+            console.print(f"\n{message}")
+
     def kill_process(self, pid: int, force: bool = False) -> bool:
         """프로세스 종료"""
         try:
             signal_type = signal.SIGKILL if force else signal.SIGTERM
             signal_name = "SIGKILL" if force else "SIGTERM"
             
-            try:
-                os.kill(pid, signal_type)
-                console.print(f"\n[green]✓ Sent {signal_name} to process {pid}[/green]")
-                return True
-            except PermissionError:
-                cmd = f"echo '{self.sudo_password}' | sudo -S kill -{signal_type} {pid}"
-                subprocess.run(cmd, shell=True, check=True, capture_output=True)
-                console.print(f"\n[green]✓ Killed process {pid} with sudo[/green]")
-                return True
+            os.kill(pid, signal_type)
+            self.notify(f"[green]✓ Sent {signal_name} to process {pid}[/green]")
+            return True
                 
         except ProcessLookupError:
-            console.print(f"\n[yellow]Process {pid} already terminated[/yellow]")
+            self.notify(f"[yellow]Process {pid} already terminated[/yellow]")
             return True
+        except PermissionError:
+            # 다른 사용자 프로세스: sudo로 실행하거나 CAP_KILL 필요 (README 참고)
+            self.notify(f"[red]✗ Permission denied killing process {pid} (run with sudo or grant CAP_KILL)[/red]")
+            return False
         except Exception as e:
-            console.print(f"\n[red]✗ Error killing process {pid}: {e}[/red]")
+            self.notify(f"[red]✗ Error killing process {pid}: {e}[/red]")
             return False
     
     def get_non_blocking_input(self, timeout=1):
-        """비차단 입력 받기"""
+        """비차단 입력 받기
+
+        수집 스레드가 wakeup()으로 깨우면 입력 없이(None) 바로 반환한다.
+        """
+        if self._selector is not None:
+            stdin_ready = False
+            for key, _ in self._selector.select(timeout):
+                if key.fd == self._wakeup_r:
+                    # 쌓인 깨우기 신호 비우기
+                    try:
+                        os.read(self._wakeup_r, 64)
+                    except BlockingIOError:
+                        pass
+                else:
+                    stdin_ready = True
+            if not stdin_ready:
+                return None
+            data = os.read(sys.stdin.fileno(), 1)
+            return data.decode(errors='ignore') if data else None
         if sys.stdin in select.select([sys.stdin], [], [], timeout)[0]:
-            return sys.stdin.read(1)
+            data = os.read(sys.stdin.fileno(), 1)
+            return data.decode(errors='ignore') if data else None
         return None
 
     
@@ -255,13 +728,15 @@ class InteractivePortMonitor:
         sys.stdout.flush()
         
         input_text = ""
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
         while True:
-            if time.time() - start_time > timeout:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
                 
-            char = self.get_non_blocking_input(0.1)
+            # 키 입력(또는 수집 스레드 wakeup)이 올 때까지 한 번에 대기 (0.1초 폴링 없음)
+            char = self.get_non_blocking_input(remaining)
             if char == '\n' or char == '\r':
                 break
             elif char and char.isdigit():
@@ -295,53 +770,66 @@ class InteractivePortMonitor:
             except:
                 is_terminal = False
         
+        if not is_terminal:
+            # 비터미널 환경은 입력을 기다리지 않으므로 깨우기 신호를 비워 줄 곳이 없음
+            self.close_selector()
+        
         try:
-            
-            last_update = 0
-            countdown = interval
+            # 터미널이면 Live 전체 화면 사용 (화면 지우기 없이 변경 시에만 다시 그림)
+            if is_terminal:
+                self.start_live()
+
+            # 포트 수집은 백그라운드 스레드에서, 첫 수집 결과가 반영되면 첫 화면을 그림
+            # (_last_sig가 아직 없으므로 apply_pending_ports 후 서명 비교에서 항상 다시 그림)
+            self.start_collector(interval)
+            countdown_end = time.monotonic() + interval
+            countdown_width = len(str(interval))
+            # kill 후 프로세스가 정리될 시간을 두고 수집할 시각 (sleep 대신 루프에서 확인)
+            refresh_at = None
             
             while self.running:
-                current_time = time.time()
+                if refresh_at is not None and time.monotonic() >= refresh_at:
+                    refresh_at = None
+                    self.request_refresh()
                 
-                # 갱신 시간 체크
-                if current_time - last_update >= interval:
-                    self.ports_info = self.get_open_ports()
-                    self.display_ports_with_actions(self.ports_info)
-                    last_update = current_time
-                    countdown = interval
+                # 수집 스레드가 새 결과를 내놓았으면 반영 (보이는 내용이 그대로면 다시 그리지 않음)
+                if self.apply_pending_ports():
+                    if self.visible_signature() != self._last_sig:
+                        self._needs_redraw = True
+                    countdown_end = time.monotonic() + interval
                 
-                # 카운트다운 표시 (화면 하단 고정 위치에 표시)
-                if countdown > 0:
-                    # 터미널 크기 가져오기
-                    try:
-                        term_height = os.get_terminal_size().lines
-                    except:
-                        term_height = 24  # 기본값
-                    # 커서를 화면 맨 아래줄로 이동하고 줄 지우기
-                    sys.stdout.write(f'\033[{term_height};1H')  # 마지막 줄로 이동
-                    sys.stdout.write('\033[K')  # 줄 지우기
-                    sys.stdout.write(f"[{countdown}s] No.=kill | h=hide | u=unhide | r=refresh | q=quit")
-                    sys.stdout.flush()
-                    countdown -= 1
+                # 새 데이터/키 입력으로 바뀐 내용은 루프당 한 번만 다시 그림
+                if self._needs_redraw:
+                    self._needs_redraw = False
+                    self.display_ports_with_actions()
+                
+                # 카운트다운 표시 (화면 하단 고정 위치에 표시, 토스트가 떠 있는 동안은 덮어쓰지 않음)
+                if self._toast is not None and time.monotonic() >= self._toast[0]:
+                    self._toast = None
+                # (키 입력으로 루프가 일찍 돌아도 숫자는 실제 경과 시간 기준으로만 줄어듦)
+                countdown = math.ceil(countdown_end - time.monotonic())
+                if countdown > 0 and self._toast is None:
+                    self.set_countdown(countdown, countdown_width)
                 
                 # 입력 체크 (터미널 환경에서만)
                 user_input = None
                 if is_terminal:
-                    user_input = self.get_non_blocking_input(1)
+                    # 다음 숫자가 바뀔 때까지 대기 (키 입력이나 새 수집 결과가 오면 바로 깨어남)
+                    user_input = self.get_non_blocking_input((countdown_end - time.monotonic()) % 1 or 1)
                 else:
-                    # 비터미널 환경에서는 그냥 1초 대기
-                    time.sleep(1)
+                    # 비터미널 환경에서는 입력이 없으므로 새 수집 결과가 오거나 1초가 지날 때까지 대기
+                    self._refresh_event.wait(1)
                 
                 if user_input:
+                    # 입력 프롬프트/메시지가 맨 아래 줄을 덮어쓰므로 다음 틱에는 줄 전체를 다시 씀
+                    self._countdown_row = None
                     if user_input.lower() == 'q':
+                        self.stop_live()
                         console.print("\n[yellow]Exiting...[/yellow]")
                         break
                     elif user_input.lower() == 'r':
-                        # 즉시 갱신
-                        self.ports_info = self.get_open_ports()
-                        self.display_ports_with_actions(self.ports_info)
-                        last_update = time.time()
-                        countdown = interval
+                        # 즉시 갱신 (결과가 오면 루프 맨 위에서 다시 그림)
+                        self.request_refresh()
                     elif user_input.lower() == 'h':
                         # Hide 모드 - 다음 입력을 기다림
                         sys.stdout.write('\r\033[K')
@@ -351,25 +839,25 @@ class InteractivePortMonitor:
                             hide_input = self.get_multi_char_input("Enter port number to hide: ")
                             if hide_input and hide_input.isdigit():
                                 hide_idx = int(hide_input) - 1
-                                visible_ports = [p for p in self.ports_info if p['port'] not in self.hidden_ports]
-                                if 0 <= hide_idx < len(visible_ports):
-                                    sorted_ports = sorted(visible_ports, key=lambda x: x['port'])
-                                    port_to_hide = sorted_ports[hide_idx]['port']
+                                if 0 <= hide_idx < len(self._ports_by_idx):
+                                    port_to_hide = self._ports_by_idx[hide_idx]
                                     self.hidden_ports.add(port_to_hide)
-                                    console.print(f"\n[yellow]Hidden port {port_to_hide}[/yellow]")
-                                    time.sleep(1)
+                                    self.update_visible_ports()
+                                    self.notify(f"[yellow]Hidden port {port_to_hide}[/yellow]")
                         
                         # 갱신
-                        self.display_ports_with_actions(self.ports_info)
-                        countdown = interval
+                        self._needs_redraw = True
+                        countdown_end = time.monotonic() + interval
                     elif user_input.lower() == 'u':
                         # Unhide all
                         if self.hidden_ports:
-                            console.print(f"\n[green]Unhiding all ports: {', '.join(map(str, sorted(self.hidden_ports)))}[/green]")
+                            self.notify(f"[green]Unhiding all ports: {', '.join(map(str, sorted(self.hidden_ports)))}[/green]")
                             self.hidden_ports.clear()
-                            time.sleep(1)
-                            self.display_ports_with_actions(self.ports_info)
-                        countdown = interval
+                            self.update_visible_ports()
+                            # 숨겨져 있던 포트는 상세 정보가 없으므로 바로 다시 수집
+                            self.request_refresh()
+                            self._needs_redraw = True
+                        countdown_end = time.monotonic() + interval
                     elif user_input.lower() == 's':
                         # Show specific port
                         sys.stdout.write('\r\033[K')
@@ -381,10 +869,14 @@ class InteractivePortMonitor:
                                 port_to_show = int(show_input)
                                 if port_to_show in self.hidden_ports:
                                     self.hidden_ports.remove(port_to_show)
-                                    console.print(f"\n[green]Showing port {port_to_show}[/green]")
-                                    time.sleep(1)
-                                    self.display_ports_with_actions(self.ports_info)
-                        countdown = interval
+                                    self.update_visible_ports()
+                                    self.request_refresh()
+                                    self.notify(f"[green]Showing port {port_to_show}[/green]")
+                                    self._needs_redraw = True
+                                elif port_to_show not in self._port_map:
+                                    self.notify(f"[red]Port {port_to_show} is not open[/red]")
+                                    self._needs_redraw = True
+                        countdown_end = time.monotonic() + interval
                     elif user_input.isdigit():
                         # Kill 모드 - 숫자로 시작하면 전체 번호 입력받기
                         sys.stdout.write('\r\033[K')
@@ -395,20 +887,19 @@ class InteractivePortMonitor:
 
                             # ESC 취소 처리 (None 반환)
                             if remaining_input is None:
-                                self.display_ports_with_actions(self.ports_info)
-                                countdown = interval
+                                self._needs_redraw = True
+                                countdown_end = time.monotonic() + interval
                                 continue
 
                             # 알파벳이 입력된 경우 (명령어) 처리
                             if remaining_input and remaining_input.isalpha():
                                 if remaining_input.lower() == 'q':
+                                    self.stop_live()
                                     console.print("\n[yellow]Exiting...[/yellow]")
                                     break
                                 elif remaining_input.lower() == 'r':
-                                    self.ports_info = self.get_open_ports()
-                                    self.display_ports_with_actions(self.ports_info)
-                                    last_update = time.time()
-                                    countdown = interval
+                                    self.request_refresh()
+                                    self._needs_redraw = True
                                     continue
 
                             # 숫자 조합 생성
@@ -421,34 +912,36 @@ class InteractivePortMonitor:
                         
                         if kill_input and kill_input.isdigit():
                             idx = int(kill_input) - 1
-                            visible_ports = [p for p in self.ports_info if p['port'] not in self.hidden_ports]
+                            visible_ports = self._sorted_visible
                             if 0 <= idx < len(visible_ports):
-                                sorted_ports = sorted(visible_ports, key=lambda x: x['port'])
-                                selected = sorted_ports[idx]
+                                selected = visible_ports[idx]
                                 
                                 if selected['pid']:
-                                    console.print(f"\n\n[yellow]Killing {selected['project_folder']} on port {selected['port']} (PID: {selected['pid']})...[/yellow]")
-                                    self.kill_process(selected['pid'])
-                                    time.sleep(2)
+                                    self.notify(f"[yellow]Killing {selected['project_folder']} on port {selected['port']} (PID: {selected['pid']})...[/yellow]")
+                                    if self.kill_process(selected['pid']):
+                                        # 종료한 PID의 행은 바로 빼고 다시 그림 (전체 재수집을 기다리지 않음)
+                                        self.ports_info = [p for p in self.ports_info if p['pid'] != selected['pid']]
+                                        self.update_visible_ports()
                                     
-                                    # 갱신
-                                    self.ports_info = self.get_open_ports()
-                                    self.display_ports_with_actions(self.ports_info)
-                                    last_update = time.time()
-                                    countdown = interval
+                                    # 갱신 (1초 뒤 수집으로 실제 상태 확인, 그동안에도 입력 처리)
+                                    self._needs_redraw = True
+                                    refresh_at = time.monotonic() + 1
                             else:
-                                console.print(f"\n[red]Invalid selection: {kill_input}. Available range: 1-{len(visible_ports)}[/red]")
-                                time.sleep(1)
-                                self.display_ports_with_actions(self.ports_info)
-                                countdown = interval
+                                self.notify(f"[red]Invalid selection: {kill_input}. Available range: 1-{len(visible_ports)}[/red]")
+                                self._needs_redraw = True
+                                countdown_end = time.monotonic() + interval
                         else:
                             # 갱신만 하고 계속
-                            self.display_ports_with_actions(self.ports_info)
-                            countdown = interval
+                            self._needs_redraw = True
+                            countdown_end = time.monotonic() + interval
                 
         except KeyboardInterrupt:
+            self.stop_live()
             console.print("\n[yellow]Monitoring stopped[/yellow]")
         finally:
+            self.stop_collector()
+            self.stop_live()
+            self.close_selector()
             # 터미널 설정 복원 (터미널 환경에서만)
             if old_settings:
                 try:
@@ -471,12 +964,7 @@ def main():
     
     monitor = InteractivePortMonitor(args.start_port, args.end_port)
     
-    # 초기 표시
-    ports_info = monitor.get_open_ports()
-    monitor.ports_info = ports_info
-    monitor.display_ports_with_actions(ports_info)
-    
-    # 대화형 모니터링 시작
+    # 대화형 모니터링 시작 (첫 화면은 수집 스레드의 첫 결과로 그림)
     monitor.interactive_monitor(args.interval)
 
 
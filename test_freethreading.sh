@@ -11,6 +11,7 @@ echo "1. Python 환경 확인"
 echo "----------------------------------------------------------------------"
 python3 --version
 python3 -c "import sys, sysconfig; print(f'GIL Disabled: {sysconfig.get_config_var(\"Py_GIL_DISABLED\")}')"
+python3 -c "import sys, psutil; print(f'GIL Enabled (runtime): {getattr(sys, \"_is_gil_enabled\", lambda: True)()}')"
 echo ""
 
 # 2. 필수 패키지 확인